@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK DES RERUNS DE app.py
+Exécute app.py sans navigateur avec streamlit.testing (AppTest) sur des
+paquets synthétiques, rejoue des scénarios d'interaction et mesure la
+latence des reruns (p50/p95/p99) et la mémoire maximale.
+
+Usage : python benchmarks/bench_app_reruns.py [--tailles 1000 10000 100000] [--repetitions 50]
+"""
+
+import argparse
+import json
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+import tracemalloc
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+NIVEAUX = ["hsk1", "hsk2", "hsk3"]
+
+
+def creer_paquet_synthetique(dossier, taille):
+    """Copie l'application dans un dossier temporaire avec un paquet de `taille` entrées"""
+    shutil.copy(os.path.join(ROOT, "app.py"), dossier)
+    shutil.copytree(os.path.join(ROOT, "utils"), os.path.join(dossier, "utils"),
+                    ignore=shutil.ignore_patterns("__pycache__"))
+    shutil.copytree(os.path.join(ROOT, "data"), os.path.join(dossier, "data"),
+                    ignore=shutil.ignore_patterns("hsk_data.json*", "*.db"))
+
+    donnees = {}
+    par_niveau = taille // len(NIVEAUX)
+    for niveau in NIVEAUX:
+        nb_phrases = par_niveau // 10
+        donnees[niveau] = {
+            "name": niveau.upper().replace("HSK", "HSK "),
+            "description": f"Paquet synthétique - {par_niveau} entrées",
+            "characters": [
+                {"character": f"{niveau}字{i}", "pinyin": f"zì{i}", "translation": f"mot {i}"}
+                for i in range(par_niveau - nb_phrases)
+            ],
+            "sentences": [
+                {"character": f"{niveau}句子{i}。", "pinyin": f"jùzi {i}.", "translation": f"phrase {i}"}
+                for i in range(nb_phrases)
+            ]
+        }
+
+    with open(os.path.join(dossier, "data", "hsk_data.json"), 'w', encoding='utf-8') as f:
+        json.dump(donnees, f, ensure_ascii=False, indent=2)
+
+
+def cliquer(at, key=None, label=None):
+    """Clique sur un bouton (par clé ou par libellé) et relance le script"""
+    if key is not None:
+        bouton = at.button(key=key)
+    else:
+        bouton = next(b for b in at.button if b.label == label)
+    bouton.click()
+    return relancer(at)
+
+
+def relancer(at):
+    """Relance le script et retourne la durée du rerun en secondes"""
+    debut = time.perf_counter()
+    at.run()
+    duree = time.perf_counter() - debut
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return duree
+
+
+def scenario_nouvelle_carte(at, repetitions):
+    return [cliquer(at, key="new_card_vocab") for _ in range(repetitions)]
+
+
+def scenario_changement_niveau(at, repetitions):
+    return [cliquer(at, key=f"nav_{NIVEAUX[i % len(NIVEAUX)]}") for i in range(repetitions)]
+
+
+def scenario_grammaire(at, repetitions):
+    at.radio(key="main_mode_selector").set_value("📘 Grammaire")
+    relancer(at)
+    durees = []
+    for i in range(repetitions):
+        durees.append(cliquer(at, key="next_grammar" if i % 2 == 0 else "prev_grammar"))
+    at.radio(key="main_mode_selector").set_value("📖 Vocabulaire")
+    relancer(at)
+    return durees
+
+
+def scenario_ajout_mot(at, repetitions):
+    cliquer(at, key="nav_hsk3")
+    durees = []
+    for i in range(repetitions):
+        at.text_input(key="form_chinese").input(f"新词{i}{time.time_ns()}")
+        at.text_input(key="form_pinyin").input("xīn cí")
+        at.text_input(key="form_translation").input("mot de test")
+        durees.append(cliquer(at, label="💾 Sauvegarder le mot"))
+    return durees
+
+
+SCENARIOS = {
+    "Nouvelle carte": scenario_nouvelle_carte,
+    "Changement de niveau": scenario_changement_niveau,
+    "Grammaire préc./suiv.": scenario_grammaire,
+    "Ajout de mot": scenario_ajout_mot,
+}
+
+
+def vider_caches():
+    """Vide les caches Streamlit du processus (processus « froid »)"""
+    # Hors serveur, Streamlit signale l'absence de runtime : sans importance ici
+    logging.disable(logging.WARNING)
+    try:
+        st.cache_data.clear()
+        st.cache_resource.clear()
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+def percentiles(durees):
+    """Retourne (p50, p95, p99) en millisecondes"""
+    if len(durees) < 2:
+        valeur = durees[0] * 1000 if durees else 0.0
+        return valeur, valeur, valeur
+    q = statistics.quantiles(durees, n=100, method="inclusive")
+    return q[49] * 1000, q[94] * 1000, q[98] * 1000
+
+
+def mesurer(taille, repetitions):
+    """Exécute tous les scénarios sur un paquet de cette taille"""
+    resultats = []
+    repertoire_initial = os.getcwd()
+    with tempfile.TemporaryDirectory() as dossier:
+        creer_paquet_synthetique(dossier, taille)
+        os.chdir(dossier)
+        try:
+            for nom, scenario in SCENARIOS.items():
+                # Chaque scénario repart d'un processus « froid »
+                vider_caches()
+
+                at = AppTest.from_file(os.path.join(dossier, "app.py"), default_timeout=600)
+                premier_rerun = relancer(at)
+                durees = scenario(at, repetitions)
+
+                # Mémoire : scénario rejoué sous tracemalloc, chargement des données compris
+                vider_caches()
+                at = AppTest.from_file(os.path.join(dossier, "app.py"), default_timeout=600)
+                tracemalloc.start()
+                relancer(at)
+                scenario(at, max(1, repetitions // 5))
+                _, pic = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                resultats.append((nom, premier_rerun * 1000, *percentiles(durees), pic / 1024 / 1024))
+        finally:
+            os.chdir(repertoire_initial)
+    return resultats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des reruns de app.py")
+    parser.add_argument("--tailles", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repetitions", type=int, default=50)
+    args = parser.parse_args()
+
+    print("=" * 96)
+    print("⏱️  BENCHMARK DES RERUNS DE app.py")
+    print("=" * 96)
+    print(f"{'Entrées':>8} | {'Scénario':<22} | {'1er run':>9} | {'p50':>8} | {'p95':>8} | {'p99':>8} | {'Mémoire max':>11}")
+    print("-" * 96)
+    for taille in args.tailles:
+        for nom, premier, p50, p95, p99, pic in mesurer(taille, args.repetitions):
+            print(f"{taille:>8} | {nom:<22} | {premier:7.1f}ms | {p50:6.1f}ms | {p95:6.1f}ms | "
+                  f"{p99:6.1f}ms | {pic:8.1f} Mo")
+        print("-" * 96)
+
+
+if __name__ == "__main__":
+    main()
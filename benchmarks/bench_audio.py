@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+MESURE DU CACHE AUDIO
+Génère en lot les clips d'un niveau (moteur espeak-ng s'il est installé,
+sinon moteur factice), puis compare la lecture depuis le cache à une
+synthèse par carte (avec espeak-ng seulement), et vérifie le respect du
+budget disque.
+
+Usage : python benchmarks/bench_audio.py [--niveau hsk1] [--moteur auto]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.audio import AudioCache, SilentEngine, open_engine  # noqa: E402
+
+DEFAULT_DATA_FILE = os.path.join(ROOT, "data", "hsk_complete_data.json")
+
+
+def main(niveau="hsk1", moteur="auto", limite=200):
+    with open(DEFAULT_DATA_FILE, 'r', encoding='utf-8') as f:
+        textes = [item["character"] for item in json.load(f)[niveau]["characters"]][:limite]
+    engine = open_engine(moteur) or SilentEngine()
+
+    print("=" * 60)
+    print(f"🔊 CACHE AUDIO : {len(textes)} mots {niveau.upper()} · moteur {engine.name}")
+    print("=" * 60)
+    with tempfile.TemporaryDirectory() as dossier:
+        cache = AudioCache(dossier, engine)
+
+        debut = time.perf_counter()
+        lot = cache.pregenerate_in_background(niveau, len(textes), textes)
+        lot._thread.join()
+        duree_lot = time.perf_counter() - debut
+        print(f"Lot en arrière-plan : {duree_lot:6.2f} s ({lot.done} clips, {lot.failed} échecs, "
+              f"{cache.size / 1024:.0f} Ko)")
+
+        debut = time.perf_counter()
+        for texte in textes:
+            engine.synthesize(texte)
+        synthese = (time.perf_counter() - debut) / len(textes)
+
+        debut = time.perf_counter()
+        for texte in textes:
+            assert cache.get(texte) is not None
+        lecture = (time.perf_counter() - debut) / len(textes)
+        if isinstance(engine, SilentEngine):
+            # Le moteur factice ne synthétise rien : le rapport ne mesurerait rien
+            print(f"Par carte : lecture du cache {lecture * 1e3:6.3f} ms "
+                  f"(synthèse factice, comparaison sans objet sans espeak-ng)")
+        else:
+            print(f"Par carte : synthèse {synthese * 1e3:7.2f} ms · cache {lecture * 1e3:6.3f} ms "
+                  f"(×{synthese / lecture:.1f})")
+
+        # Budget réduit au quart : les clips les moins récemment écoutés partent
+        cache.budget = cache.size // 4
+        cache.clip("你好")
+        assert cache.size <= cache.budget
+        print(f"Budget {cache.budget / 1024:.0f} Ko : {len(cache)} clips gardés, dont le dernier écouté "
+              f"({'你好' in cache})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cache audio hors ligne")
+    parser.add_argument("--niveau", default="hsk1")
+    parser.add_argument("--moteur", default="auto")
+    arguments = parser.parse_args()
+    main(arguments.niveau, arguments.moteur)
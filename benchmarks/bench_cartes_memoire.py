@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+MESURE DE LA MÉMOIRE DES CARTES DE VOCABULAIRE
+Compare, pour un niveau de 100 000 cartes, l'ancienne représentation
+(dicts figés dans l'instantané + copies typées pour le paquet) avec les
+cartes Card à __slots__, partagées par l'instantané et la table du niveau.
+
+Usage : python benchmarks/bench_cartes_memoire.py [--cartes 100000]
+"""
+
+import argparse
+import os
+import sys
+import tracemalloc
+from types import MappingProxyType
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.card import CARD_TYPES, Card  # noqa: E402
+from utils.deck import build_level_table  # noqa: E402
+from utils.snapshot import freeze  # noqa: E402
+
+
+def generer_niveau(nombre):
+    """Niveau synthétique au format du fichier JSON (un dixième de phrases)"""
+    phrases = nombre // 10
+    return {
+        "characters": [{"character": f"字{i}", "pinyin": f"zì{i}", "translation": f"mot {i}"}
+                       for i in range(nombre - phrases)],
+        "sentences": [{"character": f"句子{i}。", "pinyin": f"jùzi {i}.", "translation": f"phrase {i}"}
+                      for i in range(phrases)]
+    }
+
+
+def avant(niveau):
+    """Ancienne représentation : dicts figés + une copie typée par carte"""
+    instantane = {category: freeze(items) for category, items in niveau.items()}
+    table = tuple(
+        MappingProxyType(dict(item, type=card_type, level="hsk3", original_index=index))
+        for category, card_type in CARD_TYPES.items()
+        for index, item in enumerate(instantane[category])
+    )
+    return instantane, table
+
+
+def apres(niveau):
+    """Nouvelle représentation : une Card par élément, partagée par la table"""
+    instantane = {
+        category: tuple(Card.from_json(item, "hsk3", CARD_TYPES[category], index)
+                        for index, item in enumerate(items))
+        for category, items in niveau.items()
+    }
+    table = build_level_table("hsk3", instantane)
+    return instantane, table
+
+
+def mesurer(construire, niveau):
+    """Mémoire allouée (octets) par la structure construite"""
+    tracemalloc.start()
+    avant_construction = tracemalloc.get_traced_memory()[0]
+    resultat = construire(niveau)
+    taille = tracemalloc.get_traced_memory()[0] - avant_construction
+    tracemalloc.stop()
+    return resultat, taille
+
+
+def main(nombre=100_000):
+    niveau = generer_niveau(nombre)
+    _, memoire_avant = mesurer(avant, niveau)
+    (instantane, table), memoire_apres = mesurer(apres, niveau)
+
+    # Conversion sans perte vers le format JSON
+    assert [card.to_json() for card in instantane["characters"]] == niveau["characters"]
+    assert [card.to_json() for card in instantane["sentences"]] == niveau["sentences"]
+    assert all(Card.from_dict(card.to_dict()) == card for card in table.items[:1000])
+
+    print("=" * 56)
+    print(f"🧠 MÉMOIRE POUR {nombre:,} CARTES".replace(",", " "))
+    print("=" * 56)
+    print("(chaînes des mots partagées avec les données sources, non comptées)")
+    print(f"Dicts figés + copies typées : {memoire_avant / 1e6:8.1f} Mo "
+          f"({memoire_avant / nombre:5.0f} o/carte)")
+    print(f"Card à __slots__ partagées  : {memoire_apres / 1e6:8.1f} Mo "
+          f"({memoire_apres / nombre:5.0f} o/carte)")
+    print(f"Économie                    : {(memoire_avant - memoire_apres) / 1e6:8.1f} Mo "
+          f"({(1 - memoire_apres / memoire_avant) * 100:.0f} %)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mémoire des cartes de vocabulaire")
+    parser.add_argument("--cartes", type=int, default=100_000)
+    main(parser.parse_args().cartes)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+MESURE DU COÛT PAR RERUN DES DONNÉES INTÉGRÉES
+Compare l'ancienne construction des dictionnaires HSK_COMPLETE_DATA et
+HSK3_GRAMMAR dans le corps de app.py (refaite à chaque rerun Streamlit)
+avec le chargement paresseux mémorisé depuis data/.
+
+Usage : python benchmarks/bench_donnees_integrees.py
+"""
+
+import json
+import os
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_DATA_FILE = os.path.join(ROOT, "data", "hsk_complete_data.json")
+GRAMMAR_FILE = os.path.join(ROOT, "data", "hsk3_grammar.json")
+
+
+def charger(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main(repetitions=2000):
+    donnees = charger(DEFAULT_DATA_FILE)
+    grammaire = charger(GRAMMAR_FILE)
+
+    # Reconstituer les littéraux tels qu'ils étaient dans app.py.
+    # Streamlit met en cache le bytecode du script : seul l'exec compte par rerun.
+    source = f"HSK_COMPLETE_DATA = {donnees!r}\nHSK3_GRAMMAR = {grammaire!r}\n"
+    code = compile(source, "app.py", "exec")
+
+    avant = timeit.timeit(lambda: exec(code, {}), number=repetitions) / repetitions
+
+    # Nouveau : lecture des fichiers une seule fois, puis simple accès au cache
+    premier_chargement = timeit.timeit(
+        lambda: (charger(DEFAULT_DATA_FILE), charger(GRAMMAR_FILE)), number=20
+    ) / 20
+    cache = {"defaut": donnees, "grammaire": grammaire}
+    apres = timeit.timeit(lambda: (cache["defaut"], cache["grammaire"]),
+                          number=repetitions) / repetitions
+
+    print("=" * 50)
+    print("📏 DONNÉES INTÉGRÉES : COÛT PAR RERUN")
+    print("=" * 50)
+    print(f"Littéraux dans app.py (chaque rerun) : {avant * 1e6:8.1f} µs")
+    print(f"Chargement JSON (une fois/processus)  : {premier_chargement * 1e6:8.1f} µs")
+    print(f"Accès mémorisé (chaque rerun)         : {apres * 1e6:8.3f} µs")
+    print(f"Économie par rerun                    : {(avant - apres) * 1e6:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+MESURE DU DÉBIT DE LA NORMALISATION DU PINYIN
+Convertit tout le pinyin des données intégrées (vocabulaire HSK et exemples
+de grammaire) entre formes à diacritiques, à chiffres et sans tons, cache
+des syllabes vide puis chaud, et vérifie l'aller-retour.
+
+Usage : python benchmarks/bench_pinyin.py [--repetitions 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils import pinyin  # noqa: E402
+
+DEFAULT_DATA_FILE = os.path.join(ROOT, "data", "hsk_complete_data.json")
+GRAMMAR_FILE = os.path.join(ROOT, "data", "hsk3_grammar.json")
+CACHES = (pinyin.split_syllables, pinyin._split, pinyin._parse_word,
+          pinyin._word_to_diacritic, pinyin._word_to_numeric)
+
+
+def charger_pinyin():
+    """Tous les textes pinyin des données intégrées"""
+    with open(DEFAULT_DATA_FILE, 'r', encoding='utf-8') as f:
+        donnees = json.load(f)
+    with open(GRAMMAR_FILE, 'r', encoding='utf-8') as f:
+        grammaire = json.load(f)
+
+    textes = [item["pinyin"] for niveau in donnees.values()
+              for categorie in ("characters", "sentences") for item in niveau.get(categorie, [])]
+    textes.extend(point["example_pinyin"] for point in grammaire["lessons"])
+    return textes
+
+
+def vider_caches():
+    for cache in CACHES:
+        cache.cache_clear()
+
+
+def mesurer(fonction, textes, repetitions):
+    """Durée moyenne (s) d'un passage sur tous les textes"""
+    debut = time.perf_counter()
+    for _ in range(repetitions):
+        for texte in textes:
+            fonction(texte)
+    return (time.perf_counter() - debut) / repetitions
+
+
+def main(repetitions=20):
+    textes = charger_pinyin()
+    numeriques = [pinyin.to_numeric(texte) for texte in textes]
+
+    # Aller-retour sans perte et clés identiques quelle que soit la forme
+    echecs = [texte for texte, numerique in zip(textes, numeriques)
+              if pinyin.to_diacritic(numerique) != texte
+              or pinyin.pinyin_key(numerique) != pinyin.pinyin_key(texte)]
+
+    print("=" * 60)
+    print(f"🔤 NORMALISATION DU PINYIN ({len(textes)} textes, "
+          f"{sum(map(len, textes))} caractères)")
+    print("=" * 60)
+    for nom, fonction, entrees in (
+        ("Diacritiques -> chiffres", pinyin.to_numeric, textes),
+        ("Chiffres -> diacritiques", pinyin.to_diacritic, numeriques),
+        ("Sans tons", pinyin.to_toneless, textes),
+        ("Clé de comparaison", pinyin.pinyin_key, textes),
+        ("Syllabes", pinyin.pinyin_syllables, textes),
+    ):
+        vider_caches()
+        froid = mesurer(fonction, entrees, 1)
+        chaud = mesurer(fonction, entrees, repetitions)
+        print(f"{nom:<26}: froid {froid * 1e3:7.2f} ms · chaud {chaud * 1e3:7.2f} ms "
+              f"({len(entrees) / chaud:,.0f} textes/s)".replace(",", " "))
+
+    info = pinyin.split_syllables.cache_info()
+    print(f"Cache des syllabes        : {info.currsize} mots, {info.hits} hits / {info.misses} misses")
+    print(f"Aller-retour              : {len(textes) - len(echecs)}/{len(textes)} identiques")
+    for texte in echecs[:5]:
+        print(f"  ✗ {texte!r} -> {pinyin.to_numeric(texte)!r} -> {pinyin.to_diacritic(pinyin.to_numeric(texte))!r}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Débit de la normalisation du pinyin")
+    parser.add_argument("--repetitions", type=int, default=20)
+    main(parser.parse_args().repetitions)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+MESURE DE LA CORRECTION EN LOT DU QUIZ
+Corrige les feuilles d'une classe (30 élèves par défaut) sur des cartes HSK,
+réponse par réponse puis en un seul lot (normalisation jointe + notes
+partagées entre réponses identiques), et vérifie que les notes concordent.
+
+Usage : python benchmarks/bench_quiz.py [--eleves 30] [--cartes 50]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils.card import CARD_TYPES, Card  # noqa: E402
+from utils.pinyin import to_numeric, to_toneless  # noqa: E402
+from utils.quiz import PINYIN, TRANSLATION, _grade_key, answer_keys, grade_class  # noqa: E402
+
+DEFAULT_DATA_FILE = os.path.join(ROOT, "data", "hsk_complete_data.json")
+
+
+def charger_cartes():
+    with open(DEFAULT_DATA_FILE, 'r', encoding='utf-8') as f:
+        donnees = json.load(f)
+    return [Card.from_json(item, level_id, card_type, index)
+            for level_id, niveau in donnees.items()
+            for category, card_type in CARD_TYPES.items()
+            for index, item in enumerate(niveau.get(category, []))]
+
+
+def reponse_simulee(carte, champ, rng):
+    """Réponse d'élève : juste (sous une forme ou une autre), avec une faute, ou fausse"""
+    attendu = getattr(carte, champ)
+    tirage = rng.random()
+    if tirage < 0.5:
+        return attendu
+    if tirage < 0.7:
+        return to_numeric(attendu) if champ == PINYIN else attendu.upper()
+    if tirage < 0.85:
+        texte = to_toneless(attendu) if champ == PINYIN else attendu
+        position = rng.randrange(len(texte))
+        return texte[:position] + texte[position + 1:]
+    return "je ne sais pas"
+
+
+def un_par_un(cartes, feuilles, champ):
+    """Correction naïve : normalisation et note recalculées pour chaque cellule"""
+    return [[_grade_key(answer_keys([reponse], champ)[0], carte, champ)
+             for carte, reponse in zip(cartes, feuille)] for feuille in feuilles]
+
+
+def main(eleves=30, nombre_cartes=50, repetitions=20):
+    rng = random.Random(42)
+    cartes = rng.sample(charger_cartes(), nombre_cartes)
+
+    print("=" * 60)
+    print(f"🏫 CORRECTION EN LOT : {eleves} élèves × {nombre_cartes} cartes")
+    print("=" * 60)
+    for champ in (PINYIN, TRANSLATION):
+        feuilles = [[reponse_simulee(carte, champ, rng) for carte in cartes] for _ in range(eleves)]
+
+        debut = time.perf_counter()
+        for _ in range(repetitions):
+            naif = un_par_un(cartes, feuilles, champ)
+        duree_naif = (time.perf_counter() - debut) / repetitions
+
+        debut = time.perf_counter()
+        for _ in range(repetitions):
+            lot = grade_class(cartes, feuilles, champ)
+        duree_lot = (time.perf_counter() - debut) / repetitions
+
+        assert [[g.correct for g in row] for row in naif] == [[g.correct for g in row] for row in lot]
+        justes = sum(grade.correct for row in lot for grade in row)
+        print(f"{champ:<12}: une par une {duree_naif * 1e3:6.2f} ms · en lot {duree_lot * 1e3:6.2f} ms "
+              f"(×{duree_naif / duree_lot:.1f}) · {justes}/{eleves * nombre_cartes} justes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Correction en lot du quiz")
+    parser.add_argument("--eleves", type=int, default=30)
+    parser.add_argument("--cartes", type=int, default=50)
+    arguments = parser.parse_args()
+    main(arguments.eleves, arguments.cartes)
@@ -1,5 +1,108 @@
+import io
+
 import streamlit as st
+
+from utils.importer import import_file
+from utils.storage import VersionConflictError, open_store
+
 st.set_page_config(page_title="Ajouter", page_icon="📝")
-st.title("📝 Ajouter vos mots HSK 3")
-st.write("Cette page sera pour ajouter des mots après vos cours.")
-st.info("Pour l'instant, ajoutez directement dans la page principale.")
+st.title("📝 Ajouter vos mots")
+st.write("Importez d'un coup les mots de vos cours (CSV, TSV ou export Anki) "
+         "et créez de nouveaux paquets pour les ranger.")
+st.info("Pour ajouter un seul mot, utilisez le formulaire de la page principale.")
+
+@st.cache_resource
+def obtenir_store():
+    """Retourne le stockage du vocabulaire (même backend que la page principale)"""
+    return open_store()
+
+# ============================================================================
+# IMPORT EN MASSE
+# ============================================================================
+st.subheader("📥 Import en masse")
+st.caption("Fichier CSV, TSV ou export texte Anki : caractère, pinyin, traduction (une ligne par mot)")
+
+store = obtenir_store()
+# Niveaux du stockage (HSK 1 à 9, paquets personnalisés) sans charger leurs cartes
+niveaux = {niveau_id: nom for niveau_id, nom, _ in store.levels()}
+
+with st.form("bulk_import_form", border=True):
+    fichier = st.file_uploader("Fichier à importer", type=["csv", "tsv", "txt"])
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        niveau = st.selectbox("Niveau", list(niveaux), index=len(niveaux) - 1, format_func=niveaux.get)
+    with col2:
+        type_item = st.selectbox(
+            "Type d'élément",
+            ["character", "sentence"],
+            format_func=lambda x: "Caractère/Mot" if x == "character" else "Phrase"
+        )
+    with col3:
+        format_fichier = st.selectbox(
+            "Format",
+            [None, "csv", "tsv", "anki"],
+            format_func=lambda x: "Automatique" if x is None else x.upper()
+        )
+
+    importer = st.form_submit_button("📥 Importer", type="primary", use_container_width=True)
+
+if importer:
+    if fichier is None:
+        st.error("❌ Choisissez un fichier à importer")
+    else:
+        categorie = "characters" if type_item == "character" else "sentences"
+        # Lecture ligne à ligne du fichier envoyé, sans le charger en entier
+        texte = io.TextIOWrapper(fichier, encoding='utf-8-sig', newline='')
+        with st.spinner("Import en cours..."):
+            rapport = import_file(store, texte, niveau, categorie, format_fichier)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Ajoutés", rapport["added"])
+        with col2:
+            st.metric("Doublons ignorés", rapport["duplicates"])
+        with col3:
+            st.metric("Lignes invalides", rapport["invalid"])
+
+        if rapport["added"]:
+            st.success(f"✅ {rapport['added']} élément(s) ajouté(s) à {niveaux[niveau]} !")
+        if rapport["elsewhere"]:
+            st.warning(f"⚠️ {rapport['elsewhere']} mot(s) figurent aussi dans un autre niveau")
+        if rapport["errors"]:
+            with st.expander("Voir les lignes invalides"):
+                for numero_ligne, raison in rapport["errors"]:
+                    st.write(f"- Ligne {numero_ligne} : {raison}")
+
+# ============================================================================
+# NOUVEAU PAQUET
+# ============================================================================
+st.divider()
+st.subheader("🗂️ Nouveau paquet")
+st.caption("Un niveau HSK 4 à 9 ou un paquet personnalisé, rempli ensuite par import ou par le formulaire")
+
+with st.form("new_level_form", border=True):
+    col1, col2 = st.columns([1, 2])
+    with col1:
+        nouvel_id = st.text_input("Identifiant *", placeholder="例如: hsk4")
+    with col2:
+        nom = st.text_input("Nom *", placeholder="例如: HSK 4")
+    description = st.text_input("Description", placeholder="例如: Niveau intermédiaire")
+
+    creer = st.form_submit_button("🗂️ Créer le paquet", use_container_width=True)
+
+if creer:
+    nouvel_id = nouvel_id.strip().lower()
+    if not nouvel_id or not nom.strip():
+        st.error("❌ Veuillez remplir tous les champs obligatoires (*)")
+    else:
+        try:
+            cree = store.create_level(nouvel_id, nom.strip(), description.strip())
+        except VersionConflictError:
+            st.warning("⚠️ Le vocabulaire vient d'être modifié par une autre session : recréez le paquet")
+        else:
+            if cree:
+                st.success(f"✅ Paquet {nom.strip()} créé !")
+                st.rerun()
+            else:
+                st.error("❌ Ce paquet existe déjà !")
@@ -0,0 +1,108 @@
+import json
+
+import streamlit as st
+
+from utils.grammar import GrammarCatalog
+from utils.history import open_history
+from utils.storage import open_store
+
+GRAMMAR_FILE = "data/hsk3_grammar.json"
+
+st.set_page_config(page_title="Statistiques", page_icon="📊")
+st.title("📊 Statistiques d'apprentissage")
+
+@st.cache_resource
+def obtenir_store():
+    """Retourne le stockage du vocabulaire (même backend que la page principale)"""
+    return open_store()
+
+@st.cache_resource
+def obtenir_catalogue_grammaire():
+    """Retourne le catalogue de grammaire indexé (construit une fois par processus)"""
+    with open(GRAMMAR_FILE, 'r', encoding='utf-8') as f:
+        return GrammarCatalog(json.load(f))
+
+# ============================================================================
+# VOCABULAIRE ET GRAMMAIRE
+# ============================================================================
+# Totaux tenus à jour par le stockage et le catalogue : aucune liste parcourue
+compteurs = obtenir_store().stats()
+catalogue = obtenir_catalogue_grammaire()
+
+st.subheader("📚 Vocabulaire")
+colonnes = st.columns(len(compteurs.levels()) + 1)
+for colonne, level_id in zip(colonnes, compteurs.levels()):
+    with colonne:
+        st.metric(level_id.upper(), compteurs.level(level_id).total)
+with colonnes[-1]:
+    st.metric("Grammaire", len(catalogue))
+
+st.bar_chart(
+    {
+        "Niveau": [level_id.upper() for level_id in compteurs.levels()],
+        "Caractères": [compteurs.level(level_id).characters for level_id in compteurs.levels()],
+        "Phrases": [compteurs.level(level_id).sentences for level_id in compteurs.levels()]
+    },
+    x="Niveau",
+    stack=False
+)
+
+with st.expander("📘 Points de grammaire par leçon"):
+    st.dataframe(
+        [{"Leçon": lesson, "Points": count} for lesson, count in catalogue.lesson_counts.items()],
+        use_container_width=True,
+        hide_index=True
+    )
+
+st.divider()
+
+# ============================================================================
+# HISTORIQUE D'APPRENTISSAGE
+# ============================================================================
+st.subheader("📅 Historique")
+
+profil = st.text_input("👤 Profil", value=st.session_state.get('profil', 'invité'))
+historique = open_history().daily_summary(profil)
+totaux = open_history().totals(profil)
+
+if not historique:
+    st.info("Aucune carte vue pour ce profil. Pratiquez sur la page principale !")
+else:
+    vues, revisions, reussites = totaux["views"], totaux["reviews"], totaux["correct"]
+    jours = len({ligne["day"] for ligne in historique})
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Cartes vues", vues)
+    with col2:
+        st.metric("Révisions notées", revisions)
+    with col3:
+        st.metric("Réussite", f"{reussites / revisions:.0%}" if revisions else "–")
+    with col4:
+        st.metric("Jours actifs", jours)
+
+    # Cartes vues par jour, une série par niveau
+    par_jour = {}
+    for ligne in historique:
+        par_jour.setdefault(ligne["day"], {})[ligne["level"].upper()] = ligne["views"]
+    niveaux = sorted({ligne["level"].upper() for ligne in historique})
+    st.bar_chart(
+        {niveau: [par_jour[jour].get(niveau, 0) for jour in par_jour] for niveau in niveaux}
+        | {"Jour": list(par_jour)},
+        x="Jour"
+    )
+
+    st.dataframe(
+        [
+            {
+                "Jour": ligne["day"],
+                "Niveau": ligne["level"].upper(),
+                "Vues": ligne["views"],
+                "Révisions": ligne["reviews"],
+                "Réussites": ligne["correct"]
+            }
+            for ligne in reversed(historique)
+        ],
+        use_container_width=True,
+        hide_index=True
+    )
@@ -0,0 +1,143 @@
+"""
+Tests de l'interface (streamlit.testing) : réglages gardés d'un mode à l'autre, révisions dues, texte échappé
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from utils.scheduler import ReviewScheduler, review_path
+
+st = pytest.importorskip("streamlit")
+testing = pytest.importorskip("streamlit.testing.v1")
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+
+@pytest.fixture
+def donnees(tmp_path, monkeypatch):
+    """Dossier de données temporaire (copie des données livrées), dossier courant de l'application"""
+    os.makedirs(tmp_path / "data")
+    for name in ("hsk_complete_data.json", "hsk3_grammar.json"):
+        shutil.copy(os.path.join(ROOT, "data", name), tmp_path / "data" / name)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HSK_TTS", "aucun")
+    return tmp_path / "data"
+
+
+def lancer():
+    # Stockage et registre sont partagés par le processus : repartir du dossier temporaire
+    st.cache_resource.clear()
+    st.cache_data.clear()
+    at = testing.AppTest.from_file(APP, default_timeout=60)
+    return at.run()
+
+
+@pytest.fixture
+def app(donnees):
+    """Application lancée dans un dossier de données temporaire"""
+    return lancer()
+
+
+def changer_mode(at, mode):
+    at.sidebar.radio(key="main_mode_selector").set_value(mode).run()
+
+
+def test_spaced_review_profile_survives_mode_switch(app):
+    app.sidebar.toggle(key="widget_revision_espacee").set_value(True).run()
+    app.sidebar.text_input(key="widget_profil").input("alice").run()
+
+    changer_mode(app, "📘 Grammaire")
+    changer_mode(app, "📖 Vocabulaire")
+
+    assert app.session_state.revision_espacee is True
+    assert app.session_state.profil == "alice"
+    assert app.sidebar.toggle(key="widget_revision_espacee").value is True
+    assert app.sidebar.text_input(key="widget_profil").value == "alice"
+
+
+def test_quiz_mode_survives_mode_switch(app):
+    app.sidebar.toggle(key="widget_quiz").set_value(True).run()
+
+    changer_mode(app, "ℹ️ À propos")
+    changer_mode(app, "📖 Vocabulaire")
+
+    assert app.session_state.quiz is True
+    assert app.sidebar.toggle(key="widget_quiz").value is True
+
+
+def test_mixed_session_weights_survive_mode_switch(app):
+    app.sidebar.toggle(key="widget_melange").set_value(True).run()
+    app.sidebar.slider(key="widget_poids_hsk1").set_value(45).run()
+
+    changer_mode(app, "📘 Grammaire")
+    changer_mode(app, "📖 Vocabulaire")
+
+    assert app.session_state.melange is True
+    assert app.session_state.poids_hsk1 == 45
+    assert app.sidebar.slider(key="widget_poids_hsk1").value == 45
+
+
+def test_grammar_page_and_filter_survive_mode_switch(app):
+    changer_mode(app, "📘 Grammaire")
+    app.sidebar.button(key="grammar_next_page").click().run()
+    assert app.sidebar.number_input(key="widget_grammar_page").value == 2
+
+    changer_mode(app, "📖 Vocabulaire")
+    changer_mode(app, "📘 Grammaire")
+    assert app.session_state.grammar_page == 2
+    assert app.sidebar.number_input(key="widget_grammar_page").value == 2
+    app.sidebar.number_input(key="widget_grammar_page").set_value(3).run()
+    assert app.session_state.grammar_page == 3
+    assert not app.exception
+
+    lecon = app.sidebar.selectbox(key="widget_grammar_filter").options[1]
+    app.sidebar.selectbox(key="widget_grammar_filter").set_value(lecon).run()
+    changer_mode(app, "📖 Vocabulaire")
+    changer_mode(app, "📘 Grammaire")
+    assert app.session_state.grammar_filter == lecon
+    assert app.sidebar.selectbox(key="widget_grammar_filter").value == lecon
+    assert app.session_state.grammar_page == 1
+
+
+def test_search_results_escape_user_text(donnees):
+    chemin = donnees / "hsk_complete_data.json"
+    with open(chemin, encoding="utf-8") as f:
+        data = json.load(f)
+    data["hsk1"]["characters"].append({"character": "粗粗", "pinyin": "**cū**", "translation": "[lien](http://x) <b>"})
+    with open(chemin, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+
+    app = lancer()
+    app.text_input(key="recherche").input("粗粗").run()
+
+    textes = [element.value for element in app.markdown if "粗粗" in element.value]
+    assert textes == [r"**粗粗** (\*\*cū\*\*) : \[lien\](http://x) \<b\> · HSK1"]
+
+
+def test_new_card_skips_due_card_until_graded(donnees):
+    planificateur = ReviewScheduler(review_path(str(donnees / "reviews"), "alice"))
+    for caractere in ("我", "你"):
+        # Ratées il y a longtemps : dues dès maintenant
+        planificateur.grade("hsk3", {"character": caractere, "type": "character", "level": "hsk3"}, 1, now=0)
+
+    app = lancer()
+    app.sidebar.toggle(key="widget_revision_espacee").set_value(True).run()
+    app.sidebar.text_input(key="widget_profil").input("alice").run()
+
+    app.button(key="new_card_vocab").click().run()
+    assert app.session_state.current_item.character == "我"
+    # Notée, la carte est replanifiée et la suivante due est montrée
+    app.button(key="show_answer_vocab").click().run()
+    app.button(key="grade_4").click().run()
+    assert app.session_state.current_item.character == "你"
+
+    # « Nouvelle carte » sans noter : la carte due n'est pas remontrée
+    for _ in range(3):
+        app.button(key="new_card_vocab").click().run()
+        assert app.session_state.current_item.character not in ("我", "你")
+    assert app.session_state.revisions_montrees[("alice", "hsk3")] == {"character:你"}
+    assert app.session_state.stats["total_viewed"] == 5
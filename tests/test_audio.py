@@ -0,0 +1,35 @@
+"""
+Tests du cache audio (moteur factice) : lots par version et budget disque
+"""
+
+from utils.audio import AudioCache, SilentEngine
+
+WORDS = ["你", "好", "谢谢", "再见", "朋友", "老师"]
+
+
+def test_batch_is_found_again_without_reading_texts(tmp_path):
+    cache = AudioCache(str(tmp_path), SilentEngine())
+    batch = cache.pregenerate_in_background("hsk1", ("lignée", 6), WORDS)
+    batch._thread.join()
+    assert batch.done == len(WORDS) and len(cache) == len(WORDS)
+
+    def never_read():
+        raise AssertionError("textes relus")
+        yield
+
+    assert cache.pregenerate_in_background("hsk1", ("lignée", 6), never_read()) is batch
+
+
+def test_batch_stops_instead_of_evicting_its_own_clips(tmp_path):
+    engine = SilentEngine()
+    clip_size = len(engine.synthesize("你"))
+    cache = AudioCache(str(tmp_path), engine, budget=3 * clip_size)
+    cache.clip("旧")
+
+    batch = cache.pregenerate_in_background("hsk1", 1, ["一", "二", "三", "四"])
+    batch._thread.join()
+
+    assert batch.full
+    assert "旧" not in cache
+    assert all(word in cache for word in ("一", "二", "三"))
+    assert "四" not in cache
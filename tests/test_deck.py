@@ -0,0 +1,97 @@
+"""
+Tests du paquet de cartes : tirage sans répétition et bits des cartes vues
+"""
+
+from utils.card import Card
+from utils.deck import Deck, SeenBitmap, build_level_table
+
+WORDS = ["我", "你", "他", "好", "谢谢", "再见", "朋友", "老师", "学生", "中国"]
+
+
+def make_level(words=WORDS):
+    return {
+        "characters": tuple(Card(word, "", "", "character", "hsk1", index) for index, word in enumerate(words)),
+        "sentences": (Card("你好！", "", "", "sentence", "hsk1", 0),),
+    }
+
+
+def draw_all(deck):
+    cards = []
+    while (card := deck.draw()) is not None:
+        cards.append(card)
+    return cards
+
+
+def test_draws_every_card_once_per_pass():
+    deck = Deck(build_level_table("hsk1", make_level()))
+
+    cards = draw_all(deck)
+
+    assert len(cards) == len(WORDS) + 1
+    assert len({card.key for card in cards}) == len(cards)
+    assert len(deck) == 0 and deck.draw() is None
+
+
+def test_reset_after_exhaustion_starts_a_new_pass():
+    deck = Deck(build_level_table("hsk1", make_level()))
+    first_pass = draw_all(deck)
+    generation = deck.generation
+
+    deck.reset()
+
+    assert deck.generation == generation + 1
+    assert len(deck) == len(first_pass)
+    assert sorted(card.key for card in draw_all(deck)) == sorted(card.key for card in first_pass)
+
+
+def test_reserved_cards_are_not_seen_until_shown():
+    deck = Deck(build_level_table("hsk1", make_level()))
+
+    generation, card = deck.reserve()
+    assert generation == deck.generation and card not in deck.seen
+    deck.release(1)
+    assert len(deck) == len(WORDS) + 1
+
+    shown = deck.draw()
+    assert shown in deck.seen
+
+
+def test_added_words_join_the_current_pass():
+    level = make_level(WORDS[:5])
+    table = build_level_table("hsk1", level)
+    deck = Deck(table)
+    drawn = [deck.draw() for _ in range(3)]
+
+    grown = dict(level, characters=level["characters"] + make_level(WORDS)["characters"][5:])
+    deck.sync(build_level_table("hsk1", grown, table))
+
+    rest = draw_all(deck)
+    assert len(drawn) + len(rest) == len(WORDS) + 1
+    assert len({card.key for card in drawn + rest}) == len(WORDS) + 1
+
+
+def test_seen_bitmap_counts_and_lists_cards_by_type():
+    seen = SeenBitmap()
+    cards = [Card(word, "", "", "character", "hsk1", index) for index, word in enumerate(WORDS)]
+    sentence = Card("你好！", "", "", "sentence", "hsk1", 0)
+    # Positions au-delà du premier octet, dans le désordre, une carte marquée deux fois
+    for position in (9, 0, 7, 8, 0):
+        seen.add(cards[position])
+    seen.add(sentence)
+
+    assert seen.count("character") == 4 and seen.count("sentence") == 1
+    assert list(seen.indexes("character")) == [0, 7, 8, 9]
+    assert cards[8] in seen and cards[1] not in seen
+    assert Card("新", "", "", "character", "hsk1", 500) not in seen
+
+    seen.clear()
+    assert seen.count("character") == 0 and cards[0] not in seen
+
+
+def test_reset_forgets_seen_cards():
+    deck = Deck(build_level_table("hsk1", make_level()))
+    draw_all(deck)
+    assert deck.seen.count("character") == len(WORDS)
+
+    deck.reset()
+    assert deck.seen.count("character") == 0 and deck.seen.count("sentence") == 0
@@ -0,0 +1,20 @@
+"""
+Tests de l'historique d'apprentissage : totaux relus depuis un journal abîmé
+"""
+
+from utils.history import SEEN, HistoryLog
+from utils.scheduler import review_path
+
+
+def test_totals_survive_interrupted_line_before_flush(tmp_path):
+    directory = str(tmp_path)
+    log = HistoryLog(directory, flush_interval=3600)
+    log.record("alice", "character:我", "hsk1", SEEN, timestamp=0)
+    log.flush()
+    # Écriture interrompue, puis un nouveau lot écrit à la suite
+    with open(review_path(directory, "alice"), "ab") as f:
+        f.write(b'{"card": "character:')
+    log.record("alice", "character:你", "hsk1", 4, timestamp=0)
+    log.flush()
+
+    assert HistoryLog(directory, flush_interval=3600).totals("alice") == {"views": 1, "reviews": 1, "correct": 1}
@@ -0,0 +1,25 @@
+"""
+Tests de l'import en masse : normalisation du pinyin et mots d'autres niveaux
+"""
+
+from utils.importer import import_rows
+from utils.storage import JournalStore
+
+DATA = {
+    "hsk1": {"name": "HSK 1", "characters": [{"character": "谢谢", "pinyin": "xièxie", "translation": "merci"}],
+             "sentences": []},
+    "perso": {"name": "Mon paquet", "characters": [], "sentences": []},
+}
+
+
+def test_import_normalizes_pinyin_and_accepts_words_of_other_levels(tmp_path):
+    store = JournalStore(str(tmp_path / "hsk_data.json"))
+    store.save(DATA)
+
+    rows = [(1, "谢谢", "xie4xie", "merci"), (2, "你好", "ni3 hao3", "bonjour")]
+    report = import_rows(store, rows, "perso", "characters")
+
+    assert report["added"] == 2
+    assert report["elsewhere"] == 1
+    assert store.find("perso", "characters", "谢谢")["pinyin"] == "xièxie"
+    assert store.find("perso", "characters", "你好")["pinyin"] == "nǐ hǎo"
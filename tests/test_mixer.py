@@ -0,0 +1,62 @@
+"""
+Tests de la séance mixte : arbre de Fenwick et tirage pondéré entre pools
+"""
+
+import random
+
+from utils.mixer import REVIEW, FenwickTree, MixedSampler
+
+
+def test_fenwick_totals_and_search():
+    tree = FenwickTree([3, 0, 5, 2])
+    assert tree.total() == 10
+    # Sommes cumulées 3, 3, 8, 10 : chaque cible tombe dans l'intervalle de son indice
+    assert [tree.find(target) for target in range(10)] == [0] * 3 + [2] * 5 + [3] * 2
+
+    tree.update(1, 4)
+    assert tree.total() == 14 and tree[1] == 4
+    assert [tree.find(target) for target in (2, 3, 6, 7, 13)] == [0, 1, 1, 2, 3]
+
+
+def test_fenwick_all_zero_samples_none():
+    assert FenwickTree([0, 0]).sample() is None
+    assert FenwickTree().sample() is None
+
+
+def test_draws_follow_configured_weights():
+    sampler = MixedSampler({"hsk3": 60, "hsk2": 30, REVIEW: 10, "hsk1": 0}, random.Random(1))
+    assert "hsk1" not in sampler
+
+    counts = {pool: 0 for pool in sampler.pools}
+    for _ in range(20000):
+        counts[sampler.draw()] += 1
+    assert abs(counts["hsk3"] / 20000 - 0.6) < 0.02
+    assert abs(counts["hsk2"] / 20000 - 0.3) < 0.02
+    assert abs(counts[REVIEW] / 20000 - 0.1) < 0.02
+
+
+def test_exhausted_pool_drops_to_zero_and_others_share_its_part():
+    sampler = MixedSampler({"hsk3": 60, "hsk2": 30, REVIEW: 10})
+    sampler.set_available("hsk3", False)
+
+    probabilities = sampler.probabilities()
+    assert probabilities["hsk3"] == 0.0
+    assert probabilities["hsk2"] == 0.75 and probabilities[REVIEW] == 0.25
+
+    sampler.reset()
+    assert sampler.probabilities()["hsk3"] == 0.6
+
+
+def test_draw_card_skips_empty_pools_until_all_are_empty():
+    cards = {"hsk1": ["我", "你"], "hsk2": [], REVIEW: ["再见"]}
+    sampler = MixedSampler({"hsk1": 1, "hsk2": 5, REVIEW: 1}, random.Random(0))
+
+    def take(pool):
+        return cards[pool].pop() if cards[pool] else None
+
+    drawn = []
+    while (draw := sampler.draw_card(take, lambda pool: bool(cards[pool]))) is not None:
+        drawn.append(draw)
+
+    assert sorted(card for _, card in drawn) == sorted(["我", "你", "再见"])
+    assert sampler.probabilities() == {"hsk1": 0.0, "hsk2": 0.0, REVIEW: 0.0}
@@ -0,0 +1,62 @@
+"""
+Tests de la normalisation du pinyin : chiffres, diacritiques, clés sans tons
+"""
+
+import pytest
+
+from utils.pinyin import (pinyin_key, pinyin_keys, pinyin_syllables, same_pinyin, split_syllables,
+                          to_diacritic, to_numeric, to_toneless)
+
+
+@pytest.mark.parametrize("numeric, diacritic", [
+    ("xie4xie", "xièxie"),
+    ("ni3 hao3", "nǐ hǎo"),
+    ("Zhong1guo2", "Zhōngguó"),
+    ("lü4", "lǜ"),
+    ("lv4", "lǜ"),
+    ("nu:3", "nǚ"),
+    ("er2", "ér"),
+    ("er4zi5", "èrzi"),
+    ("xi1an1", "xī'ān"),
+    ("xi1'an1", "xī'ān"),
+    ("ke3neng2", "kěnéng"),
+    ("dian3r", "diǎnr"),
+    ("ma5", "ma"),
+    ("hao3!", "hǎo!"),
+])
+def test_numeric_to_diacritic(numeric, diacritic):
+    assert to_diacritic(numeric) == diacritic
+
+
+@pytest.mark.parametrize("diacritic", ["xièxie", "lǜ", "nǚ", "ér", "xī'ān", "kěnéng", "diǎnr", "māma"])
+def test_diacritic_round_trip(diacritic):
+    assert to_diacritic(to_numeric(diacritic)) == diacritic
+
+
+def test_numeric_forms():
+    assert to_numeric("lǜ") == "lv4"
+    assert to_numeric("māma") == "ma1ma"
+    assert to_numeric("Xī'ān") == "Xi1an1"
+
+
+def test_toneless_keeps_umlaut():
+    assert to_toneless("lǜ") == "lü"
+    assert to_toneless("Xièxie, xie4xie") == "Xiexie, xiexie"
+
+
+def test_keys_ignore_tones_case_and_spacing():
+    assert pinyin_key("Xie xie") == pinyin_key("xièxie") == pinyin_key("xie4xie") == "xiexie"
+    assert pinyin_key("lǜ") == pinyin_key("lv4") == pinyin_key("lu:4") == "lu"
+    assert same_pinyin("XI'AN", "xī'ān")
+    assert not same_pinyin("mā", "mao")
+    assert pinyin_keys(["Nǐ hǎo", "xie4 xie", ""]) == ["nihao", "xiexie", ""]
+    assert pinyin_keys([]) == []
+
+
+def test_syllable_split():
+    # Syllabe la plus longue d'abord, a/e/o seulement en début de mot, erhua gardé
+    assert split_syllables("xian") == ("xian",)
+    assert split_syllables("keneng") == ("ke", "neng")
+    assert split_syllables("dianr") == ("dianr",)
+    assert split_syllables("hello") is None
+    assert pinyin_syllables("xièxie nǐ") == ["xie", "xie", "ni"]
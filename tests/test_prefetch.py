@@ -0,0 +1,30 @@
+"""
+Tests du préchargement des cartes : arrêt propre quand le niveau quitte la mémoire
+"""
+
+from utils.card import Card
+from utils.deck import Deck, build_level_table
+from utils.prefetch import CardPrefetcher
+
+WORDS = ["你", "好", "谢谢", "再见", "朋友", "老师"]
+
+
+def make_deck():
+    level = {"characters": tuple(Card(word, "", "", level="hsk1", original_index=index)
+                                 for index, word in enumerate(WORDS))}
+    return Deck(build_level_table("hsk1", level))
+
+
+def test_refill_after_detach_exits_quietly():
+    deck = make_deck()
+    prefetcher = CardPrefetcher(deck, depth=2)
+    prefetcher.refill()
+    assert len(prefetcher) == 2
+
+    # Ordre de detacher_niveaux_inactifs : annuler, puis détacher le paquet
+    prefetcher.cancel()
+    deck.detach()
+    prefetcher.refill()
+
+    assert len(prefetcher) == 0
+    assert len(deck) == len(WORDS)
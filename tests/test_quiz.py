@@ -0,0 +1,56 @@
+"""
+Tests de la correction des réponses tapées : une réponse, une classe
+"""
+
+import pytest
+
+from utils.card import Card
+from utils.quiz import PINYIN, TRANSLATION, class_summary, grade_answer, grade_class
+
+CARDS = [Card("谢谢", "xièxie", "merci"), Card("我", "wǒ", "je, moi"), Card("朋友", "péngyou", "ami (camarade)")]
+
+
+def grades(row):
+    return [(grade.exact, grade.correct) for grade in row]
+
+
+def test_grade_class_pinyin():
+    results = grade_class(CARDS, [
+        ["xie4xie", "wo3", "pengyou"],
+        ["xiexei", "ni", "Péng you"],
+        ["", "WO"],
+    ], PINYIN)
+
+    assert grades(results[0]) == [(True, True)] * 3
+    # Faute de frappe acceptée, mauvaise syllabe refusée ; tons, casse et espaces ignorés
+    assert grades(results[1]) == [(False, True), (False, False), (True, True)]
+    # Feuille incomplète : les réponses manquantes comptent comme vides
+    assert grades(results[2]) == [(False, False), (True, True), (False, False)]
+    assert [grade.quality for grade in results[1]] == [4, 1, 5]
+
+    assert class_summary(results) == ([3, 2, 1], [2 / 3, 2 / 3, 2 / 3])
+
+
+def test_grade_class_translation():
+    results = grade_class(CARDS, [["Merci !", "moi", "l'ami"], ["mersi", "je", "camarade"]], TRANSLATION)
+
+    # Chaque sens est accepté ; articles, accents et ponctuation ignorés ; précision entre parenthèses ignorée
+    assert grades(results[0]) == [(True, True)] * 3
+    assert grades(results[1]) == [(False, True), (True, True), (False, False)]
+    assert results[1][0].expected == "merci"
+
+
+def test_identical_answers_share_one_grade():
+    results = grade_class(CARDS[:1], [["xiexie"], ["xie4xie"], ["XIEXIE"]], PINYIN)
+    assert results[0][0] is results[1][0] is results[2][0]
+
+
+def test_short_answers_get_no_typo_tolerance():
+    assert not grade_answer(Card("我", "wǒ", "je"), "wa", PINYIN).correct
+
+
+def test_empty_class_and_unknown_field():
+    assert grade_class([], [["a"], ["b"]]) == [[], []]
+    assert class_summary([]) == ([], [])
+    with pytest.raises(ValueError):
+        grade_class(CARDS, [[]], "character")
@@ -0,0 +1,78 @@
+"""
+Tests du planificateur de révisions (SM-2) et de son journal
+"""
+
+from utils.scheduler import DAY, MIN_EASE, RELEARN_DELAY, CardState, ReviewScheduler, sm2
+
+WORD = {"character": "我", "type": "character", "level": "hsk1"}
+
+
+def test_load_skips_interrupted_and_corrupted_lines(tmp_path):
+    path = str(tmp_path / "alice.jsonl")
+    ReviewScheduler(path).grade("hsk1", WORD, 4, now=0)
+    with open(path, "ab") as f:
+        f.write(b'{"level": "hsk1", "key": "char\n{"level": "hs')
+
+    scheduler = ReviewScheduler(path)
+    assert scheduler.tracked("hsk1") == 1
+    scheduler.grade("hsk1", {"character": "你", "type": "character", "level": "hsk1"}, 4, now=0)
+
+    assert ReviewScheduler(path).tracked("hsk1") == 2
+
+
+def word(character):
+    return {"character": character, "type": "character", "level": "hsk1"}
+
+
+def test_sm2_intervals_and_ease_progression():
+    state = CardState(WORD)
+    intervals = [sm2(state, 4, now=0).interval for _ in range(4)]
+    # 1 jour, 6 jours, puis l'intervalle précédent multiplié par la facilité (2.5, inchangée à la note 4)
+    assert intervals == [1, 6, 15, 38]
+    assert state.ease == 2.5 and state.due == 38 * DAY
+
+    sm2(state, 5, now=0)
+    assert round(state.ease, 2) == 2.6
+
+
+def test_sm2_failure_relearns_soon_and_lowers_ease():
+    state = sm2(sm2(CardState(WORD), 4, now=0), 4, now=0)
+
+    sm2(state, 1, now=100)
+    assert state.repetitions == 0 and state.interval == 1
+    assert state.due == 100 + RELEARN_DELAY
+    assert round(state.ease, 2) == 1.96
+
+    for _ in range(10):
+        sm2(state, 0, now=0)
+    assert state.ease == MIN_EASE
+
+
+def test_next_due_returns_most_overdue_card_first(tmp_path):
+    scheduler = ReviewScheduler(str(tmp_path / "alice.jsonl"))
+    scheduler.grade("hsk1", word("我"), 4, now=2 * DAY)
+    scheduler.grade("hsk1", word("你"), 4, now=0)
+    scheduler.grade("hsk1", word("他"), 4, now=DAY)
+    scheduler.grade("hsk2", word("再"), 4, now=0)
+
+    assert scheduler.next_due("hsk1", now=0) is None
+    assert scheduler.next_due("hsk1", now=10 * DAY)["character"] == "你"
+    # Regradée, la carte repart à sa nouvelle échéance (l'ancienne entrée du tas est ignorée)
+    scheduler.grade("hsk1", word("你"), 4, now=10 * DAY)
+    assert scheduler.next_due("hsk1", now=10 * DAY)["character"] == "他"
+    assert scheduler.next_due("hsk1", now=10 * DAY, skip={"character:他"})["character"] == "我"
+    assert scheduler.next_due("hsk1", now=10 * DAY, skip={"character:他", "character:我"}) is None
+    assert scheduler.next_due("hsk1", now=10 * DAY)["character"] == "他"
+
+
+def test_reviews_are_replayed_after_restart(tmp_path):
+    path = str(tmp_path / "alice.jsonl")
+    scheduler = ReviewScheduler(path)
+    scheduler.grade("hsk1", word("我"), 4, now=0)
+    scheduler.grade("hsk1", word("我"), 4, now=DAY)
+
+    restarted = ReviewScheduler(path)
+    assert restarted.tracked("hsk1") == 1
+    # Deuxième bonne réponse : revue 6 jours après la note
+    assert restarted.next_due("hsk1", now=7 * DAY - 1) is None
+    assert restarted.next_due("hsk1", now=7 * DAY)["character"] == "我"
@@ -0,0 +1,247 @@
+"""
+Tests du stockage : migration JSON -> SQLite, compteurs, journal et conflits d'écriture
+"""
+
+import copy
+import multiprocessing
+import threading
+
+import pytest
+
+from utils.storage import FileLock, JournalStore, VersionConflictError, open_store
+
+DATA = {
+    "hsk1": {
+        "name": "HSK 1",
+        "description": "Débutant",
+        "characters": [{"character": "你", "pinyin": "nǐ", "translation": "tu"}],
+        "sentences": [],
+    }
+}
+WORD = {"character": "好", "pinyin": "hǎo", "translation": "bien"}
+
+
+def test_sqlite_import_replays_journal(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    store = JournalStore(data_file, compact_threshold=10**6)
+    store.save(copy.deepcopy(DATA))
+    assert store.append("hsk1", "characters", WORD)
+
+    sqlite = open_store("sqlite", data_file, str(tmp_path / "hsk_data.db"))
+    try:
+        assert sqlite.contains("hsk1", "characters", "好")
+        assert not sqlite.append("hsk1", "characters", WORD)
+        assert sqlite.stats().level("hsk1").characters == 2
+    finally:
+        sqlite.close()
+
+
+def test_sqlite_import_includes_clean_file(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    JournalStore(data_file).save(copy.deepcopy(DATA))
+    clean = copy.deepcopy(DATA)
+    clean["hsk1"]["characters"] = [{"character": "你", "pinyin": "ni3", "translation": "toi"}, WORD]
+    JournalStore(str(tmp_path / "hsk_data_clean.json")).save(clean)
+
+    sqlite = open_store("sqlite", data_file, str(tmp_path / "hsk_data.db"))
+    try:
+        # Mots des deux fichiers ; pour un doublon, celui du fichier principal
+        assert sqlite.contains("hsk1", "characters", "好")
+        assert sqlite.find("hsk1", "characters", "你")["translation"] == "tu"
+        assert sqlite.stats().level("hsk1").characters == 2
+    finally:
+        sqlite.close()
+
+def test_save_after_mutating_loaded_data_rebuilds_stats(tmp_path):
+    store = JournalStore(str(tmp_path / "hsk_data.json"))
+    store.save(copy.deepcopy(DATA))
+
+    data = store.load()
+    data["hsk1"]["characters"].append(dict(WORD))
+    store.save(data)
+    assert store.stats().level("hsk1").characters == 2
+
+    data = store.load()
+    data["hsk1"]["characters"].append(dict(WORD))
+    store.save(data)
+    store.deduplicate()
+    assert store.stats().level("hsk1").characters == 2
+
+
+def test_append_after_interrupted_write_keeps_journal_readable(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    store = JournalStore(data_file, compact_threshold=10**6)
+    store.save(copy.deepcopy(DATA))
+    assert store.append("hsk1", "characters", WORD)
+    # Écriture interrompue : la dernière ligne n'a pas de fin de ligne
+    with open(store.journal_path, "ab") as f:
+        f.write('{"op": "add", "level": "hsk1", "category": "charac'.encode("utf-8"))
+
+    assert store.append("hsk1", "characters", {"character": "们", "pinyin": "men", "translation": "(pluriel)"})
+
+    reloaded = JournalStore(data_file)
+    assert [item["character"] for item in reloaded.load()["hsk1"]["characters"]] == ["你", "好", "们"]
+    assert reloaded.stats().level("hsk1").characters == 3
+
+
+def test_replay_skips_corrupted_lines(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    store = JournalStore(data_file, compact_threshold=10**6)
+    store.save(copy.deepcopy(DATA))
+    # Ligne abîmée écrite par une version sans réparation du journal
+    with open(store.journal_path, "ab") as f:
+        f.write(b'{"op": "add", "lev{"op": "add"}\n')
+    assert store.append("hsk1", "characters", WORD)
+
+    assert JournalStore(data_file).contains("hsk1", "characters", "好")
+
+
+def test_first_append_after_save_does_not_reload_base(tmp_path):
+    store = JournalStore(str(tmp_path / "hsk_data.json"), compact_threshold=10**6)
+    store.save(copy.deepcopy(DATA))
+    data = store.load()
+    assert store.append("hsk1", "characters", WORD)
+
+    # Le journal créé par l'ajout n'est pas pris pour un journal remplacé par un compactage
+    assert store.load() is data
+
+
+def test_journal_written_by_several_stores(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    first = JournalStore(data_file, compact_threshold=10**6)
+    first.save(copy.deepcopy(DATA))
+    second = JournalStore(data_file, compact_threshold=10**6)
+
+    assert first.append("hsk1", "characters", WORD)
+    assert not second.append("hsk1", "characters", WORD)
+    assert second.append("hsk1", "sentences", {"character": "你好！", "pinyin": "nǐ hǎo", "translation": "bonjour"})
+
+    assert first.contains("hsk1", "sentences", "你好！")
+    assert first.stats().level("hsk1").characters == 2
+
+
+def test_compaction_keeps_appends(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    store = JournalStore(data_file, compact_threshold=10**6)
+    store.save(copy.deepcopy(DATA))
+    words = [{"character": chr(0x4e00 + n), "pinyin": "", "translation": ""} for n in range(20)]
+    assert store.append_many("hsk1", "characters", words[:10]) == 10
+
+    store.compact()
+    assert store.append_many("hsk1", "characters", words[10:]) == 10
+
+    assert JournalStore(data_file).stats().level("hsk1").characters == 21
+
+
+def write_before_save(monkeypatch, store, write):
+    """Fait écrire un autre processus juste avant la sauvegarde du store"""
+    save = store.save
+
+    def save_after_write(data, expected_version=None):
+        write()
+        return save(data, expected_version)
+
+    monkeypatch.setattr(store, "save", save_after_write)
+
+
+def test_deduplicate_conflicts_with_concurrent_append(tmp_path, monkeypatch):
+    data_file = str(tmp_path / "hsk_data.json")
+    first = JournalStore(data_file, compact_threshold=10**6)
+    data = copy.deepcopy(DATA)
+    data["hsk1"]["characters"].append(dict(data["hsk1"]["characters"][0]))
+    first.save(data)
+    second = JournalStore(data_file, compact_threshold=10**6)
+    write_before_save(monkeypatch, first, lambda: second.append("hsk1", "characters", WORD))
+
+    with pytest.raises(VersionConflictError):
+        first.deduplicate()
+
+    # Rien n'est perdu : le mot ajouté est gardé, le doublon est retiré au nouvel essai
+    monkeypatch.undo()
+    assert first.contains("hsk1", "characters", "好")
+    assert len(first.deduplicate()) == 1
+    assert [item["character"] for item in JournalStore(data_file).load()["hsk1"]["characters"]] == ["你", "好"]
+
+
+def test_create_level_conflicts_with_concurrent_append(tmp_path, monkeypatch):
+    data_file = str(tmp_path / "hsk_data.json")
+    first = JournalStore(data_file, compact_threshold=10**6)
+    first.save(copy.deepcopy(DATA))
+    second = JournalStore(data_file, compact_threshold=10**6)
+    write_before_save(monkeypatch, first, lambda: second.append("hsk1", "characters", WORD))
+
+    with pytest.raises(VersionConflictError):
+        first.create_level("perso", "Perso")
+    assert "perso" not in first.load()
+
+    monkeypatch.undo()
+    assert first.create_level("perso", "Perso")
+    assert JournalStore(data_file).contains("hsk1", "characters", "好")
+
+
+def test_first_install_conflicts_with_other_process(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    first = JournalStore(data_file)
+    expected_version = first.version()
+    JournalStore(data_file).save(copy.deepcopy(DATA))
+
+    with pytest.raises(VersionConflictError):
+        first.save({"hsk2": {"name": "HSK 2", "characters": [], "sentences": []}}, expected_version)
+    assert list(JournalStore(data_file).load()) == ["hsk1"]
+
+
+def test_sqlite_save_conflicts_with_other_connection(tmp_path):
+    db_file = str(tmp_path / "hsk_data.db")
+    first = open_store("sqlite", str(tmp_path / "absent.json"), db_file)
+    second = open_store("sqlite", str(tmp_path / "absent.json"), db_file)
+    try:
+        first.save(copy.deepcopy(DATA))
+        expected_version = first.version()
+        assert second.append("hsk1", "characters", WORD)
+
+        with pytest.raises(VersionConflictError):
+            first.save(copy.deepcopy(DATA), expected_version)
+        assert first.contains("hsk1", "characters", "好")
+    finally:
+        first.close()
+        second.close()
+
+
+def append_words(data_file, start):
+    """Processus écrivain : une moitié de mots à lui, l'autre partagée avec les autres processus"""
+    store = JournalStore(data_file, compact_threshold=10**6)
+    added = 0
+    for n in range(40):
+        character = f"{start}-{n}" if n % 2 else f"commun-{n}"
+        added += store.append("hsk1", "characters", {"character": character, "pinyin": "", "translation": ""})
+    return added
+
+
+def test_writer_processes_add_each_word_once(tmp_path):
+    data_file = str(tmp_path / "hsk_data.json")
+    JournalStore(data_file).save(copy.deepcopy(DATA))
+
+    with multiprocessing.get_context("spawn").Pool(4) as pool:
+        added = pool.starmap(append_words, [(data_file, start) for start in range(4)])
+
+    # 20 mots propres à chaque processus + 20 mots communs ajoutés une seule fois
+    assert sum(added) == 4 * 20 + 20
+    characters = [item["character"] for item in JournalStore(data_file).load()["hsk1"]["characters"]]
+    assert len(characters) == len(set(characters)) == 1 + 4 * 20 + 20
+
+
+def test_file_lock_is_reentrant_and_exclusive(tmp_path):
+    lock = FileLock(str(tmp_path / "data.lock"))
+    entered = threading.Event()
+
+    def other_thread():
+        with lock:
+            entered.set()
+
+    with lock:
+        with lock:
+            thread = threading.Thread(target=other_thread)
+            thread.start()
+            assert not entered.wait(0.2)
+    thread.join(5)
+    assert entered.is_set()
@@ -0,0 +1,319 @@
+# utils/audio.py
+"""
+Prononciation hors ligne : moteur de synthèse local et cache audio sur disque
+"""
+
+import hashlib
+import io
+import os
+import shutil
+import subprocess
+import threading
+import wave
+from collections import OrderedDict
+
+from utils.storage import replace_file
+
+AUDIO_DIR = "data/audio"
+# Taille maximale du cache sur disque (les clips les moins récemment écoutés partent d'abord)
+AUDIO_BUDGET = 64 * 1024 * 1024
+SAMPLE_RATE = 22050
+# Échecs possibles d'une synthèse (moteur absent ou planté, disque plein)
+SYNTHESIS_ERRORS = (OSError, subprocess.SubprocessError)
+
+
+class EspeakEngine:
+    """Synthèse par espeak-ng (voix mandarin), un processus par clip WAV"""
+
+    name = "espeak-ng"
+
+    def __init__(self, executable, voice="cmn", speed=130):
+        self.executable = executable
+        self.voice = voice
+        self.speed = speed
+        result = subprocess.run([executable, "--version"], capture_output=True, text=True, check=False)
+        self.version = result.stdout.strip()
+
+    @classmethod
+    def find(cls):
+        """Moteur espeak-ng (ou espeak) installé, ou None"""
+        executable = shutil.which("espeak-ng") or shutil.which("espeak")
+        return cls(executable) if executable else None
+
+    @property
+    def settings(self):
+        """Réglages qui changent le son produit (partie de l'adresse d'un clip)"""
+        return f"{self.version}|{self.voice}|{self.speed}"
+
+    def synthesize(self, text):
+        """Clip WAV du texte"""
+        result = subprocess.run([self.executable, "-v", self.voice, "-s", str(self.speed), "--stdout", "--", text],
+                                capture_output=True, check=True, timeout=30)
+        return result.stdout
+
+
+class SilentEngine:
+    """Moteur factice (essais, mesures) : un silence WAV dont la durée suit le texte"""
+
+    name = "silent"
+    settings = "1"
+
+    def __init__(self, seconds_per_character=0.05):
+        self.seconds_per_character = seconds_per_character
+
+    def synthesize(self, text):
+        """Clip WAV muet"""
+        buffer = io.BytesIO()
+        with wave.open(buffer, "wb") as clip:
+            clip.setnchannels(1)
+            clip.setsampwidth(2)
+            clip.setframerate(SAMPLE_RATE)
+            clip.writeframes(bytes(2 * int(SAMPLE_RATE * self.seconds_per_character * max(1, len(text)))))
+        return buffer.getvalue()
+
+
+def open_engine(name="auto"):
+    """
+    Moteur de synthèse : "espeak" (espeak-ng), "silent" (factice),
+    "auto" (espeak-ng s'il est installé) ; None si aucun n'est disponible.
+    """
+    if name == "silent":
+        return SilentEngine()
+    if name in ("auto", "espeak"):
+        return EspeakEngine.find()
+    return None
+
+
+class AudioBatch:
+    """
+    Génération en arrière-plan des clips d'une liste de textes (un niveau, la grammaire).
+
+    `full` indique que le lot s'est arrêté faute de place : continuer aurait
+    supprimé ses propres clips (lot plus gros que le budget du cache).
+    """
+
+    __slots__ = ("version", "texts", "done", "failed", "full", "addresses", "_cancelled", "_thread")
+
+    def __init__(self, version, texts):
+        self.version = version
+        self.texts = texts
+        self.done = 0
+        self.failed = 0
+        self.full = False
+        # Clips du lot, que ses propres ajouts ne doivent pas évincer
+        self.addresses = set()
+        self._cancelled = False
+        self._thread = None
+
+    def __len__(self):
+        return len(self.texts)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def cancel(self):
+        """Arrête la génération après le clip en cours"""
+        self._cancelled = True
+
+
+class AudioCache:
+    """
+    Clips audio adressés par leur contenu, gardés sur disque dans la limite d'un budget.
+
+    L'adresse d'un clip est l'empreinte SHA-256 du moteur, de ses réglages
+    et du texte : un même texte n'est synthétisé qu'une fois, et changer de
+    voix ne réutilise pas d'anciens clips. L'ordre LRU est tenu en mémoire
+    (chargé au démarrage d'après les dates de modification, mises à jour à
+    chaque écoute) ; au-delà de `budget` octets, les clips les moins
+    récemment écoutés sont supprimés.
+    """
+
+    def __init__(self, directory, engine, budget=AUDIO_BUDGET):
+        self.directory = directory
+        self.engine = engine
+        self.budget = budget
+        self._lock = threading.Lock()
+        self._clips = OrderedDict()
+        self._size = 0
+        self._batches = {}
+        self._load()
+
+    def _load(self):
+        """Recense les clips déjà sur disque, du moins au plus récemment écouté"""
+        if not os.path.isdir(self.directory):
+            return
+        found = []
+        for prefix in os.scandir(self.directory):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                if entry.name.endswith(".wav"):
+                    stat = entry.stat()
+                    found.append((stat.st_mtime, entry.name[:-4], stat.st_size))
+        for _, address, size in sorted(found):
+            self._clips[address] = size
+            self._size += size
+
+    def address(self, text):
+        """Empreinte du clip de ce texte pour le moteur actuel"""
+        key = f"{self.engine.name}|{self.engine.settings}|{text.strip()}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _path(self, address):
+        return os.path.join(self.directory, address[:2], f"{address}.wav")
+
+    def __contains__(self, text):
+        address = self.address(text)
+        with self._lock:
+            return address in self._clips or os.path.exists(self._path(address))
+
+    def __len__(self):
+        return len(self._clips)
+
+    @property
+    def size(self):
+        """Octets occupés par les clips recensés"""
+        return self._size
+
+    def get(self, text):
+        """Clip déjà en cache (marqué récemment écouté), ou None"""
+        address = self.address(text)
+        path = self._path(address)
+        try:
+            with open(path, "rb") as f:
+                clip = f.read()
+        except FileNotFoundError:
+            with self._lock:
+                if address in self._clips:
+                    self._size -= self._clips.pop(address)
+            return None
+
+        with self._lock:
+            if address not in self._clips:
+                # Clip écrit par un autre processus
+                self._size += len(clip)
+                self._clips[address] = len(clip)
+            self._clips.move_to_end(address)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return clip
+
+    def _fits(self, size, keep):
+        """Indique si `size` octets de plus tiennent sans évincer un clip de `keep`"""
+        excess = self._size + size - self.budget
+        for address, clip_size in self._clips.items():
+            if excess <= 0:
+                return True
+            if address in keep:
+                return False
+            excess -= clip_size
+        return excess <= 0 or not keep
+
+    def _touch(self, address):
+        """Marque un clip comme récemment utilisé (en mémoire seulement)"""
+        with self._lock:
+            if address in self._clips:
+                self._clips.move_to_end(address)
+
+    def _put(self, address, clip):
+        """Enregistre un clip (écriture atomique) puis respecte le budget"""
+        path = self._path(address)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(clip)
+        replace_file(tmp_path, path)
+
+        with self._lock:
+            self._size += len(clip) - self._clips.pop(address, 0)
+            self._clips[address] = len(clip)
+            self._evict()
+
+    def _evict(self):
+        """Supprime les clips les moins récemment écoutés au-delà du budget (le dernier reste)"""
+        while self._size > self.budget and len(self._clips) > 1:
+            address, size = self._clips.popitem(last=False)
+            self._size -= size
+            try:
+                os.remove(self._path(address))
+            except FileNotFoundError:
+                pass
+
+    def clip(self, text):
+        """Clip du texte, synthétisé et mis en cache s'il n'y est pas encore"""
+        clip = self.get(text)
+        if clip is None:
+            clip = self.engine.synthesize(text.strip())
+            self._put(self.address(text), clip)
+        return clip
+
+    def pregenerate(self, texts, batch=None):
+        """
+        Synthétise les clips manquants, dans l'ordre (retourne le nombre de clips créés).
+
+        Avec un lot, ses clips (déjà présents ou créés) sont protégés : le lot
+        s'arrête (`full`) plutôt que d'évincer ses propres clips.
+        """
+        batch = batch if batch is not None else AudioBatch(None, texts)
+        created = 0
+        for text in texts:
+            if batch._cancelled:
+                break
+            if text and text.strip():
+                address = self.address(text)
+                if text in self:
+                    self._touch(address)
+                else:
+                    try:
+                        clip = self.engine.synthesize(text.strip())
+                    except SYNTHESIS_ERRORS:
+                        batch.failed += 1
+                        batch.done += 1
+                        continue
+                    with self._lock:
+                        fits = self._fits(len(clip), batch.addresses)
+                    if not fits:
+                        batch.full = True
+                        break
+                    self._put(address, clip)
+                    created += 1
+                batch.addresses.add(address)
+            batch.done += 1
+        return created
+
+    def batch(self, name):
+        """Dernier lot lancé sous ce nom, ou None"""
+        with self._lock:
+            return self._batches.get(name)
+
+    def pregenerate_in_background(self, name, version, texts):
+        """
+        Lance (une fois par version) la génération des clips d'un lot nommé dans un thread.
+
+        Si le dernier lot de ce nom a la même `version` (par exemple lignée et
+        taille de la table du niveau), il est retourné sans lire `texts` : un
+        itérable paresseux ne coûte alors rien. Sinon l'ancien lot est arrêté
+        et un nouveau démarre (les clips déjà en cache sont sautés).
+        """
+        with self._lock:
+            batch = self._batches.get(name)
+            if batch is not None and batch.version == version:
+                return batch
+            if batch is not None:
+                batch.cancel()
+        texts = tuple(texts)
+        with self._lock:
+            batch = self._batches[name] = AudioBatch(version, texts)
+            batch._thread = threading.Thread(target=self.pregenerate, args=(texts, batch),
+                                             name=f"audio-{name}", daemon=True)
+        batch._thread.start()
+        return batch
+
+    def cancel(self):
+        """Arrête tous les lots en cours"""
+        with self._lock:
+            for batch in self._batches.values():
+                batch.cancel()
@@ -0,0 +1,88 @@
+# utils/card.py
+"""
+Enregistrement compact d'une carte de vocabulaire
+"""
+
+import sys
+
+# Catégorie du fichier JSON -> type de carte
+CARD_TYPES = {"characters": "character", "sentences": "sentence"}
+JSON_FIELDS = ("character", "pinyin", "translation")
+
+
+class Card:
+    """
+    Carte de vocabulaire : caractère, pinyin, traduction, type, niveau et position.
+
+    Classe à __slots__ (pas de dict par instance) et en lecture seule, car
+    les cartes sont partagées par toutes les sessions ; le type et le niveau
+    sont des chaînes internées. Les champs JSON inconnus sont gardés dans
+    `extra` pour une conversion sans perte.
+    """
+
+    __slots__ = ("character", "pinyin", "translation", "type", "level", "original_index", "extra")
+
+    def __init__(self, character, pinyin, translation, type="character", level="",
+                 original_index=None, extra=None):
+        set_field = object.__setattr__
+        set_field(self, "character", character)
+        set_field(self, "pinyin", pinyin)
+        set_field(self, "translation", translation)
+        set_field(self, "type", sys.intern(type))
+        set_field(self, "level", sys.intern(level))
+        set_field(self, "original_index", original_index)
+        set_field(self, "extra", extra)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card est en lecture seule")
+
+    def __reduce__(self):
+        return (Card, (self.character, self.pinyin, self.translation, self.type, self.level,
+                       self.original_index, self.extra))
+
+    @property
+    def key(self):
+        """Clé de la carte dans son niveau : type + caractère"""
+        return f"{self.type}:{self.character}"
+
+    @classmethod
+    def from_json(cls, item, level="", card_type="character", original_index=None):
+        """Carte à partir d'un élément du fichier JSON (character, pinyin, translation)"""
+        extra = {key: value for key, value in item.items() if key not in JSON_FIELDS} or None
+        return cls(item["character"], item.get("pinyin", ""), item.get("translation", ""),
+                   card_type, level, original_index, extra)
+
+    def to_json(self):
+        """Élément au format du fichier JSON"""
+        item = {"character": self.character, "pinyin": self.pinyin, "translation": self.translation}
+        if self.extra:
+            item.update(self.extra)
+        return item
+
+    @classmethod
+    def from_dict(cls, record):
+        """Carte à partir d'un dict complet (JSON + type, level, original_index)"""
+        extra = {key: value for key, value in record.items()
+                 if key not in JSON_FIELDS and key not in ("type", "level", "original_index")} or None
+        return cls(record["character"], record.get("pinyin", ""), record.get("translation", ""),
+                   record.get("type", "character"), record.get("level", ""),
+                   record.get("original_index"), extra)
+
+    def to_dict(self):
+        """Dict complet de la carte (JSON + type, level, original_index)"""
+        record = self.to_json()
+        record.update(type=self.type, level=self.level)
+        if self.original_index is not None:
+            record["original_index"] = self.original_index
+        return record
+
+    def __eq__(self, other):
+        if not isinstance(other, Card):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash((self.level, self.type, self.character))
+
+    def __repr__(self):
+        return f"Card({self.character!r}, {self.pinyin!r}, {self.translation!r}, type={self.type!r}, level={self.level!r})"
@@ -0,0 +1,252 @@
+# utils/deck.py
+"""
+Paquet de cartes pour le tirage aléatoire sans répétition
+"""
+
+import random
+import threading
+from array import array
+
+from utils.card import CARD_TYPES
+
+
+def _grew(items, previous):
+    """Indique si `items` prolonge `previous` (mêmes éléments, ajouts à la fin)"""
+    if len(items) < len(previous):
+        return False
+    return not previous or items[len(previous) - 1] is previous[-1]
+
+
+class LevelTable:
+    """
+    Table immuable des cartes d'un niveau, partagée par toutes les sessions.
+
+    Les cartes (Card) sont celles de l'instantané du niveau, sans copie :
+    caractères puis phrases, puis les mots ajoutés depuis, dans leur ordre
+    d'arrivée : la position d'une carte ne change jamais tant que le niveau
+    ne fait que grandir (les tables successives ont alors la même lignée).
+    """
+
+    __slots__ = ("level", "items", "sources", "lineage")
+
+    def __init__(self, level, items, sources, lineage):
+        self.level = level
+        self.items = items
+        self.sources = sources
+        self.lineage = lineage
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, position):
+        return self.items[position]
+
+    def extends(self, other):
+        """Indique si cette table prolonge `other` (positions inchangées)"""
+        return other is not None and self.lineage is other.lineage and len(self) >= len(other)
+
+
+def build_level_table(level_id, level, previous=None):
+    """
+    Construit la table d'un niveau.
+
+    Si le niveau a seulement grandi depuis `previous`, seules les nouvelles
+    cartes sont ajoutées ; s'il n'a pas changé, `previous` est retournée.
+    """
+    sources = tuple(level.get(category, ()) for category in CARD_TYPES)
+
+    if previous is not None and all(map(_grew, sources, previous.sources)):
+        if all(len(items) == len(old) for items, old in zip(sources, previous.sources)):
+            return previous
+        added = tuple(card for items, old in zip(sources, previous.sources) for card in items[len(old):])
+        return LevelTable(level_id, previous.items + added, sources, previous.lineage)
+
+    items = tuple(card for category_items in sources for card in category_items)
+    return LevelTable(level_id, items, sources, object())
+
+
+class TableLayout:
+    """
+    Disposition d'une table sans ses cartes : lignée, ordre des positions et
+    taille de chaque catégorie.
+
+    Permet de reconstruire une table identique (même lignée, mêmes positions)
+    à partir de cartes rechargées, par exemple après avoir retiré un niveau
+    inactif de la mémoire : les paquets des sessions restent alors valides.
+    """
+
+    __slots__ = ("lineage", "codes", "lengths", "last_characters")
+
+    def __init__(self, table):
+        type_index = {card_type: index for index, card_type in enumerate(CARD_TYPES.values())}
+        self.lineage = table.lineage
+        # Une carte = position dans sa catégorie * nombre de catégories + catégorie
+        self.codes = array('I', (card.original_index * len(type_index) + type_index[card.type]
+                                 for card in table.items))
+        self.lengths = tuple(len(items) for items in table.sources)
+        self.last_characters = tuple(items[-1].character if items else None for items in table.sources)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def rebuild(self, level_id, level):
+        """
+        Table du niveau disposée comme l'ancienne, ou None si le niveau a
+        changé autrement que par des ajouts (la table doit alors repartir de zéro).
+        """
+        sources = tuple(level.get(category, ()) for category in CARD_TYPES)
+        for items, length, last_character in zip(sources, self.lengths, self.last_characters):
+            if len(items) < length or (length and items[length - 1].character != last_character):
+                return None
+        count = len(sources)
+        items = tuple(sources[code % count][code // count] for code in self.codes)
+        added = tuple(card for category_items, length in zip(sources, self.lengths)
+                      for card in category_items[length:])
+        return LevelTable(level_id, items + added, sources, self.lineage)
+
+
+class SeenBitmap:
+    """
+    Cartes déjà vues d'un niveau : un bit par carte, un tableau d'octets par type.
+
+    Le bit d'une carte est sa position dans sa catégorie (original_index) ;
+    les compteurs sont des comptages de bits, sans ensemble de chaînes.
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self):
+        self._bits = {card_type: bytearray() for card_type in CARD_TYPES.values()}
+
+    def add(self, card):
+        """Marque une carte comme vue"""
+        bits = self._bits[card.type]
+        index = card.original_index
+        if index >> 3 >= len(bits):
+            bits.extend(bytes((index >> 3) + 1 - len(bits)))
+        bits[index >> 3] |= 1 << (index & 7)
+
+    def __contains__(self, card):
+        bits = self._bits[card.type]
+        index = card.original_index
+        return index >> 3 < len(bits) and bool(bits[index >> 3] & (1 << (index & 7)))
+
+    def count(self, card_type):
+        """Nombre de cartes vues de ce type"""
+        return int.from_bytes(self._bits[card_type], 'little').bit_count()
+
+    def indexes(self, card_type):
+        """Positions (original_index) des cartes vues de ce type, dans l'ordre"""
+        for byte_index, byte in enumerate(self._bits[card_type]):
+            while byte:
+                low_bit = byte & -byte
+                yield (byte_index << 3) + low_bit.bit_length() - 1
+                byte ^= low_bit
+
+    def clear(self):
+        """Oublie toutes les cartes vues"""
+        for bits in self._bits.values():
+            bits.clear()
+
+
+class Deck:
+    """
+    Paquet de cartes d'une table, tirées au hasard sans répétition jusqu'à épuisement.
+
+    Le paquet ne copie aucune carte : il mélange une permutation des positions
+    de la table (Fisher-Yates incrémental), si bien qu'un tirage coûte O(1)
+    et qu'une réinitialisation remet seulement le curseur à zéro. Les cartes
+    tirées sont marquées dans `seen` (quelques octets par carte au total).
+
+    Le paquet peut être tiré depuis un thread de préchargement : un verrou
+    protège le curseur, et `generation` change à chaque remise à zéro pour
+    que les cartes tirées d'avance d'un ancien tour soient écartées.
+    """
+
+    def __init__(self, table):
+        # LevelTable, ou TableLayout quand le niveau a été retiré de la mémoire (detach)
+        self.table = table
+        self.order = array('I', range(len(table)))
+        self.cursor = 0
+        self.seen = SeenBitmap()
+        self.generation = 0
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """Nombre de cartes restant à tirer"""
+        return len(self.order) - self.cursor
+
+    def draw(self, mark_seen=True):
+        """
+        Tire une carte non encore vue, ou None si le paquet est épuisé.
+
+        Avec mark_seen=False (tirage d'avance), la carte ne sera marquée vue
+        qu'à son affichage, par mark_seen().
+        """
+        with self._lock:
+            if self.cursor >= len(self.order):
+                return None
+
+            # Échanger une position restante au hasard avec le curseur
+            j = random.randrange(self.cursor, len(self.order))
+            self.order[self.cursor], self.order[j] = self.order[j], self.order[self.cursor]
+            item = self.table[self.order[self.cursor]]
+            self.cursor += 1
+            if mark_seen:
+                self.seen.add(item)
+            return item
+
+    def reserve(self):
+        """Tire une carte d'avance, non marquée vue : (génération, carte) ou None"""
+        with self._lock:
+            item = self.draw(mark_seen=False)
+            return None if item is None else (self.generation, item)
+
+    def release(self, count):
+        """Remet dans le paquet les `count` dernières cartes tirées d'avance"""
+        with self._lock:
+            self.cursor = max(0, self.cursor - count)
+
+    def detach(self):
+        """
+        Lâche les cartes de la table (niveau retiré de la mémoire).
+
+        Seule sa disposition est gardée : le prochain sync() avec la table
+        rechargée (même lignée) reprend le paquet là où il en était.
+        """
+        with self._lock:
+            if isinstance(self.table, LevelTable):
+                self.table = TableLayout(self.table)
+
+    def mark_seen(self, item):
+        """Marque vue une carte tirée d'avance"""
+        with self._lock:
+            self.seen.add(item)
+
+    def sync(self, table):
+        """
+        Suit une nouvelle version de la table.
+
+        Les cartes ajoutées rejoignent celles qui restent à tirer ; si la table
+        a été reconstruite (dédoublonnage, rechargement), le paquet repart de zéro.
+        """
+        if table is self.table:
+            return
+        with self._lock:
+            if table.extends(self.table):
+                self.order.extend(range(len(self.table), len(table)))
+            else:
+                self.order = array('I', range(len(table)))
+                self.cursor = 0
+                self.seen.clear()
+                self.generation += 1
+            self.table = table
+
+    def reset(self, table=None):
+        """Remet toutes les cartes dans le paquet"""
+        with self._lock:
+            if table is not None:
+                self.sync(table)
+            self.cursor = 0
+            self.seen.clear()
+            self.generation += 1
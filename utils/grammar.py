@@ -0,0 +1,109 @@
+# utils/grammar.py
+"""
+Catalogue des points de grammaire avec index précalculés
+"""
+
+import math
+import random
+from types import MappingProxyType
+
+from utils.render import GrammarFragments
+
+
+class GrammarCatalog:
+    """
+    Points de grammaire indexés une seule fois.
+
+    Position d'un point, navigation précédent/suivant, filtrage par leçon et
+    tirage aléatoire se font en temps constant, quel que soit le nombre de
+    points chargés.
+    """
+
+    def __init__(self, grammar):
+        self.name = grammar["name"]
+        self.description = grammar["description"]
+        self.author = grammar.get("author", "")
+        self.points = tuple(grammar["lessons"])
+
+        self._positions = {}
+        # Position de chaque point dans sa leçon (pour retrouver sa page)
+        self._lesson_positions = {}
+        by_lesson = {}
+        for position, point in enumerate(self.points):
+            self._positions[point["id"]] = position
+            lesson_points = by_lesson.setdefault(point["lesson"], [])
+            self._lesson_positions[point["id"]] = len(lesson_points)
+            lesson_points.append(point)
+
+        self._by_lesson = {lesson: tuple(points) for lesson, points in by_lesson.items()}
+        self.lessons = tuple(sorted(self._by_lesson))
+        # Nombre de points par leçon (page Statistiques)
+        self.lesson_counts = MappingProxyType({lesson: len(self._by_lesson[lesson]) for lesson in self.lessons})
+
+        # Lignes du tableau récapitulatif
+        self.table_rows = tuple(
+            {
+                "N°": position,
+                "Leçon": point["lesson"],
+                "Point de grammaire": point["title"],
+                "Structure": point["structure"][:50] + "..." if len(point["structure"]) > 50 else point["structure"]
+            }
+            for position, point in enumerate(self.points, 1)
+        )
+
+        # Exemples prêts à afficher (HTML échappé), sans formatage au rerun
+        self._fragments = {point["id"]: GrammarFragments(point) for point in self.points}
+
+    def fragments(self, point):
+        """Fragments d'affichage de l'exemple d'un point (préparés à la construction)"""
+        fragments = self._fragments.get(point.get("id"))
+        return fragments if fragments is not None else GrammarFragments(point)
+
+    def __len__(self):
+        return len(self.points)
+
+    def position(self, point_id):
+        """Position (à partir de 0) d'un point, ou 0 si l'identifiant est inconnu"""
+        return self._positions.get(point_id, 0)
+
+    def get(self, point_id):
+        """Point de grammaire de cet identifiant, ou None"""
+        position = self._positions.get(point_id)
+        return self.points[position] if position is not None else None
+
+    def neighbour(self, point_id, step):
+        """Point situé `step` positions plus loin, ou None hors du catalogue"""
+        position = self.position(point_id) + step
+        if 0 <= position < len(self.points):
+            return self.points[position]
+        return None
+
+    def points_for_lesson(self, lesson):
+        """Points d'une leçon (tous les points si la leçon est None)"""
+        if lesson is None:
+            return self.points
+        return self._by_lesson.get(lesson, ())
+
+    def page_count(self, lesson, page_size):
+        """Nombre de pages de `page_size` points pour une leçon (None : toutes)"""
+        return max(1, math.ceil(len(self.points_for_lesson(lesson)) / page_size))
+
+    def page(self, lesson, number, page_size):
+        """Points de la page `number` (à partir de 0) : seule la tranche affichée est copiée"""
+        start = number * page_size
+        return self.points_for_lesson(lesson)[start:start + page_size]
+
+    def page_of(self, point_id, lesson, page_size):
+        """Page (à partir de 0) où se trouve un point, ou None s'il n'est pas dans la leçon"""
+        if lesson is None:
+            position = self._positions.get(point_id)
+        else:
+            point = self.get(point_id)
+            if point is None or point["lesson"] != lesson:
+                return None
+            position = self._lesson_positions[point_id]
+        return None if position is None else position // page_size
+
+    def random_point(self):
+        """Point de grammaire tiré au hasard"""
+        return random.choice(self.points)
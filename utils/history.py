@@ -0,0 +1,180 @@
+# utils/history.py
+"""
+Historique d'apprentissage : journal des cartes vues et notées, par apprenant
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+
+from utils.scheduler import review_path
+from utils.storage import parse_record, repair_tail
+
+HISTORY_DIR = "data/history"
+# Résultats enregistrés : carte affichée, ou note SM-2 (0 à 5) après révision
+SEEN = "seen"
+# Une note SM-2 à partir de 3 compte comme une bonne réponse
+PASSING_QUALITY = 3
+
+
+def day_of(timestamp):
+    """Jour (heure locale, AAAA-MM-JJ) d'un horodatage"""
+    return time.strftime("%Y-%m-%d", time.localtime(timestamp))
+
+
+class DailyTotals:
+    """Compteurs d'un apprenant pour un jour et un niveau"""
+
+    __slots__ = ("views", "reviews", "correct")
+
+    def __init__(self):
+        self.views = 0
+        self.reviews = 0
+        self.correct = 0
+
+    def add(self, outcome):
+        """Compte un événement"""
+        if outcome == SEEN:
+            self.views += 1
+        else:
+            self.reviews += 1
+            if outcome >= PASSING_QUALITY:
+                self.correct += 1
+
+
+class HistoryLog:
+    """
+    Journal des événements d'apprentissage (un fichier JSONL par apprenant).
+
+    record() ne fait qu'ajouter l'événement à un tampon en mémoire : un
+    thread l'écrit par lots, toutes les `flush_interval` secondes ou dès que
+    `max_buffer` événements attendent. Les totaux (par jour et par niveau,
+    et globaux) sont calculés une fois par apprenant en lisant son journal,
+    puis tenus à jour à chaque événement.
+    """
+
+    def __init__(self, directory, flush_interval=5.0, max_buffer=200):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._buffer = []
+        self._totals = {}
+        self._wake = threading.Event()
+        self._thread = None
+        atexit.register(self.flush)
+
+    def record(self, user, card, level, outcome, timestamp=None):
+        """Enregistre un événement (sans accès disque)"""
+        timestamp = time.time() if timestamp is None else timestamp
+        event = {"user": user, "card": card, "level": level,
+                 "ts": round(timestamp, 3), "outcome": outcome}
+        with self._lock:
+            self._buffer.append(event)
+            totals = self._totals.get(user)
+            if totals is not None:
+                self._count(totals, event)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="history-flush", daemon=True)
+                self._thread.start()
+            if len(self._buffer) >= self.max_buffer:
+                self._wake.set()
+
+    def _run(self):
+        """Boucle du thread d'écriture"""
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Écrit les événements en attente (une écriture par apprenant)"""
+        with self._flush_lock:
+            with self._lock:
+                events, self._buffer = self._buffer, []
+            if not events:
+                return
+
+            by_user = {}
+            for event in events:
+                line = json.dumps({key: value for key, value in event.items() if key != "user"},
+                                  ensure_ascii=False)
+                by_user.setdefault(event["user"], []).append(line + "\n")
+
+            os.makedirs(self.directory, exist_ok=True)
+            for user, lines in by_user.items():
+                path = review_path(self.directory, user)
+                # Une ligne interrompue (plantage) se collerait au lot : la retirer d'abord
+                repair_tail(path)
+                with open(path, 'a', encoding='utf-8') as f:
+                    f.write("".join(lines))
+
+    @staticmethod
+    def _count(totals, event):
+        """Ajoute un événement aux totaux ({(jour, niveau): DailyTotals}, DailyTotals global)"""
+        by_day, overall = totals
+        key = (day_of(event["ts"]), event["level"])
+        entry = by_day.get(key)
+        if entry is None:
+            entry = by_day[key] = DailyTotals()
+        entry.add(event["outcome"])
+        overall.add(event["outcome"])
+
+    def _load_totals(self, user):
+        """Totaux d'un apprenant : journal sur disque + événements en attente"""
+        totals = self._totals.get(user)
+        if totals is not None:
+            return totals
+
+        totals = ({}, DailyTotals())
+        with self._flush_lock:
+            path = review_path(self.directory, user)
+            if os.path.exists(path):
+                with open(path, 'rb') as f:
+                    for line in f:
+                        # Lignes interrompues ou abîmées par un plantage : ignorées
+                        event = parse_record(line) if line.endswith(b"\n") else None
+                        if event is not None:
+                            self._count(totals, event)
+            with self._lock:
+                for event in self._buffer:
+                    if event["user"] == user:
+                        self._count(totals, event)
+                self._totals[user] = totals
+        return totals
+
+    def daily_summary(self, user):
+        """
+        Totaux par jour et par niveau, du plus ancien au plus récent.
+
+        Chaque ligne : jour, niveau, cartes vues, révisions notées, bonnes réponses.
+        """
+        by_day, _ = self._load_totals(user)
+        with self._lock:
+            return [
+                {"day": day, "level": level, "views": entry.views,
+                 "reviews": entry.reviews, "correct": entry.correct}
+                for (day, level), entry in sorted(by_day.items())
+            ]
+
+    def totals(self, user):
+        """Totaux globaux d'un apprenant : cartes vues, révisions notées, bonnes réponses (O(1))"""
+        _, overall = self._load_totals(user)
+        with self._lock:
+            return {"views": overall.views, "reviews": overall.reviews, "correct": overall.correct}
+
+
+_logs = {}
+_logs_lock = threading.Lock()
+
+
+def open_history(directory=HISTORY_DIR):
+    """Journal partagé par tout le processus pour ce dossier (page principale et autres pages)"""
+    with _logs_lock:
+        log = _logs.get(directory)
+        if log is None:
+            log = _logs[directory] = HistoryLog(directory)
+        return log
@@ -0,0 +1,211 @@
+# utils/importer.py
+"""
+Import en masse du vocabulaire depuis des fichiers CSV, TSV ou exports texte Anki
+"""
+
+import argparse
+import csv
+import itertools
+import re
+
+from utils.pinyin import same_pinyin, to_diacritic
+
+# Nombre maximal d'erreurs détaillées dans le rapport d'import
+MAX_REPORTED_ERRORS = 100
+
+# Lettres du pinyin (avec tons), chiffres de ton, ponctuation des phrases
+PINYIN_PATTERN = re.compile(
+    r"^[a-zA-Züvāáǎàēéěèīíǐìōóǒòūúǔùǖǘǚǜ"
+    r"ĀÁǍÀĒÉĚÈĪÍǏÌŌÓǑÒŪÚǓÙǕǗǙǛÜ0-5\s'’·,.!?;:…\-\"“”()（），。！？]+$"
+)
+HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+
+HEADER_NAMES = {
+    "character": ("character", "caractère", "caractere", "chinois", "hanzi", "front"),
+    "pinyin": ("pinyin",),
+    "translation": ("translation", "traduction", "français", "francais", "back"),
+}
+
+
+def is_valid_pinyin(pinyin):
+    """Vérifie qu'une chaîne ressemble à du pinyin (tons accentués ou numériques)"""
+    return bool(pinyin) and bool(PINYIN_PATTERN.match(pinyin)) and any(c.isalpha() for c in pinyin)
+
+
+def normalize_entry(character, pinyin, translation):
+    """
+    Élément au format du fichier JSON, tel qu'enregistré par le formulaire
+    comme par l'import : pinyin avec diacritiques (xie4xie -> xièxie).
+    """
+    return {"character": character.strip(), "pinyin": to_diacritic(pinyin.strip()),
+            "translation": translation.strip()}
+
+
+def levels_with_word(store, levels, category, entry):
+    """
+    Niveaux de `levels` qui ont déjà ce mot (même caractère, même pinyin aux
+    tons près). Simple avertissement : un mot peut figurer dans plusieurs
+    niveaux (HSK et paquet personnalisé, par exemple).
+    """
+    found = []
+    for level in levels:
+        existing = store.find(level, category, entry["character"])
+        if existing is not None and same_pinyin(existing["pinyin"], entry["pinyin"]):
+            found.append(level)
+    return found
+
+
+def _clean(field):
+    """Retire les balises HTML (exports Anki) et les espaces superflus"""
+    return HTML_TAG_PATTERN.sub("", field).replace("&nbsp;", " ").strip()
+
+
+def _detect_format(filename, fmt):
+    if fmt:
+        return fmt
+    if filename.lower().endswith(".csv"):
+        return "csv"
+    if filename.lower().endswith(".tsv"):
+        return "tsv"
+    return "anki"
+
+
+def iter_rows(lines, fmt="csv"):
+    """
+    Lit les lignes une par une et produit (numéro de ligne, caractère, pinyin, traduction).
+
+    Formats : "csv", "tsv" ou "anki" (texte séparé par tabulations, avec des
+    en-têtes optionnels « #separator:... »). Une première ligne nommant les
+    colonnes est reconnue et utilisée pour les réordonner.
+    """
+    delimiter = "," if fmt == "csv" else "\t"
+    lines = iter(lines)
+    skipped = 0
+    first_line = []
+
+    if fmt == "anki":
+        # En-têtes Anki : #separator:tab, #html:true, ...
+        for line in lines:
+            if not line.startswith("#"):
+                first_line.append(line)
+                break
+            skipped += 1
+            key, _, value = line[1:].strip().partition(":")
+            if key == "separator":
+                delimiter = {"tab": "\t", "comma": ",", "semicolon": ";",
+                             "pipe": "|", "space": " "}.get(value.lower(), value[:1] or "\t")
+
+    reader = csv.reader(itertools.chain(first_line, lines), delimiter=delimiter)
+    columns = (0, 1, 2)
+    first_row = True
+
+    for fields in reader:
+        line_number = skipped + reader.line_num
+        if not any(field.strip() for field in fields):
+            continue
+        fields = [_clean(field) for field in fields]
+
+        if first_row:
+            first_row = False
+            lowered = [field.lower() for field in fields]
+            header = {}
+            for name, aliases in HEADER_NAMES.items():
+                for position, field in enumerate(lowered):
+                    if field in aliases:
+                        header[name] = position
+            if len(header) == 3:
+                columns = (header["character"], header["pinyin"], header["translation"])
+                continue
+
+        if len(fields) <= max(columns):
+            yield line_number, None, None, None
+            continue
+        yield line_number, fields[columns[0]], fields[columns[1]], fields[columns[2]]
+
+
+def import_rows(store, rows, level, category, batch_size=1000):
+    """
+    Importe des lignes dans le stockage par lots de `batch_size`.
+
+    Les doublons (déjà présents ou répétés dans le fichier) sont ignorés et
+    le pinyin est validé puis normalisé (normalize_entry). Retourne un
+    rapport : ajoutés, doublons, lignes invalides (et le détail des
+    premières erreurs), et mots ajoutés qui figurent aussi dans un autre
+    niveau (« elsewhere », avertissement seulement).
+    """
+    report = {"added": 0, "duplicates": 0, "invalid": 0, "errors": [], "elsewhere": 0}
+    existing = store.character_index(level, category)
+    others = [other for other, _, _ in store.levels() if other != level]
+    other_characters = [store.character_index(other, category) for other in others]
+    seen = set()
+    batch = []
+
+    def flush():
+        if batch:
+            # Un autre écrivain a pu ajouter certains mots depuis la lecture de l'index
+            added = store.append_many(level, category, batch)
+            report["added"] += added
+            report["duplicates"] += len(batch) - added
+            batch.clear()
+
+    def reject(line_number, reason):
+        report["invalid"] += 1
+        if len(report["errors"]) < MAX_REPORTED_ERRORS:
+            report["errors"].append((line_number, reason))
+
+    for line_number, character, pinyin, translation in rows:
+        if not character or not translation:
+            reject(line_number, "colonnes manquantes")
+            continue
+        if not is_valid_pinyin(pinyin):
+            reject(line_number, f"pinyin invalide : {pinyin!r}")
+            continue
+        if character in seen or character in existing:
+            report["duplicates"] += 1
+            continue
+
+        seen.add(character)
+        entry = normalize_entry(character, pinyin, translation)
+        candidates = [other for other, characters in zip(others, other_characters) if character in characters]
+        if candidates and levels_with_word(store, candidates, category, entry):
+            report["elsewhere"] += 1
+        batch.append(entry)
+        if len(batch) >= batch_size:
+            flush()
+
+    flush()
+    return report
+
+
+def import_file(store, file, level, category, fmt=None, batch_size=1000):
+    """Importe un fichier texte déjà ouvert (CSV, TSV ou export Anki)"""
+    fmt = _detect_format(getattr(file, "name", ""), fmt)
+    return import_rows(store, iter_rows(file, fmt), level, category, batch_size)
+
+
+if __name__ == "__main__":
+    from utils.storage import open_store
+
+    parser = argparse.ArgumentParser(description="Import en masse de vocabulaire HSK")
+    parser.add_argument("fichier", help="Fichier CSV, TSV ou export texte Anki")
+    parser.add_argument("--niveau", default="hsk3", help="Niveau cible (ex. hsk3)")
+    parser.add_argument("--type", default="character", choices=["character", "sentence"])
+    parser.add_argument("--format", choices=["csv", "tsv", "anki"], help="Détecté d'après l'extension par défaut")
+    parser.add_argument("--backend", choices=["json", "sqlite"], help="Stockage (HSK_STORAGE par défaut)")
+    parser.add_argument("--lot", type=int, default=1000, help="Taille des lots d'écriture")
+    args = parser.parse_args()
+
+    store = open_store(args.backend)
+    store.load()
+    categorie = "characters" if args.type == "character" else "sentences"
+    with open(args.fichier, 'r', encoding='utf-8-sig', newline='') as f:
+        rapport = import_file(store, f, args.niveau, categorie, args.format, args.lot)
+
+    print(f"✅ {rapport['added']} élément(s) ajouté(s) au {args.niveau.upper()}")
+    print(f"↩️  {rapport['duplicates']} doublon(s) ignoré(s)")
+    if rapport["elsewhere"]:
+        print(f"⚠️  {rapport['elsewhere']} mot(s) déjà présent(s) dans un autre niveau")
+    if rapport["invalid"]:
+        print(f"❌ {rapport['invalid']} ligne(s) invalide(s) :")
+        for line_number, raison in rapport["errors"][:20]:
+            print(f"   ligne {line_number} : {raison}")
@@ -0,0 +1,163 @@
+# utils/levels.py
+"""
+Registre des niveaux (HSK 1 à 9, paquets personnalisés), chargés à la demande
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from utils.deck import TableLayout, build_level_table
+from utils.render import RenderCache
+from utils.snapshot import SnapshotCache
+
+# Un niveau qu'aucune session n'a ouvert depuis ce délai est retiré de la mémoire
+IDLE_SECONDS = 600
+
+
+class LevelInfo:
+    """Identifiant, nom et description d'un niveau (sans ses cartes)"""
+
+    __slots__ = ("id", "name", "description")
+
+    def __init__(self, level_id, name, description=""):
+        self.id = level_id
+        self.name = name
+        self.description = description
+
+
+class _ResidentLevel:
+    """Niveau chargé : données figées, table des cartes et dernier accès"""
+
+    __slots__ = ("level", "table", "last_used")
+
+    def __init__(self, level, table, last_used):
+        self.level = level
+        self.table = table
+        self.last_used = last_used
+
+
+class LevelRegistry:
+    """
+    Niveaux découverts dans le stockage, dont les cartes ne sont chargées
+    qu'à l'ouverture.
+
+    La liste des niveaux (identifiant, nom, description) vient du stockage.
+    level()/table() chargent un niveau, le figent et construisent sa table ; un niveau inactif depuis `idle_seconds` (ou le
+    moins récemment utilisé au-delà de `max_resident` niveaux) est retiré
+    de la mémoire. Sa disposition (TableLayout) est gardée : rechargé, il
+    retrouve la même table, et les paquets des sessions restent valides.
+    Les fragments d'affichage des cartes (`renders`) sont préparés avec la
+    table et oubliés avec elle.
+
+    Avec SQLiteStore, seul le niveau ouvert est lu dans la base. Avec
+    JournalStore, le fichier JSON reste chargé en entier (liste des niveaux
+    comme cartes d'un niveau) : seuls les objets figés (cartes, tables,
+    fragments) sont chargés à la demande et libérés.
+    """
+
+    def __init__(self, store, idle_seconds=IDLE_SECONDS, max_resident=None):
+        self.store = store
+        self.idle_seconds = idle_seconds
+        self.max_resident = max_resident
+        self._lock = threading.RLock()
+        self._snapshots = SnapshotCache()
+        self._resident = OrderedDict()
+        self._layouts = {}
+        self.renders = RenderCache()
+
+    # ------------------------------------------------------------------
+    # Liste des niveaux
+    # ------------------------------------------------------------------
+    def infos(self):
+        """Niveaux du stockage dans leur ordre (JournalStore : lecture du JSON complet, gardé en cache)"""
+        return tuple(LevelInfo(*row) for row in self.store.levels())
+
+    def ids(self):
+        """Identifiants des niveaux, dans l'ordre du stockage"""
+        return tuple(info.id for info in self.infos())
+
+    def info(self, level_id):
+        """Informations d'un niveau, ou None s'il n'existe pas"""
+        return next((info for info in self.infos() if info.id == level_id), None)
+
+    def __contains__(self, level_id):
+        return self.info(level_id) is not None
+
+    def version(self, level_id):
+        """
+        (lignée, nombre de cartes) de la dernière table du niveau, sans le
+        charger ; None s'il n'a jamais été ouvert.
+        """
+        with self._lock:
+            entry = self._resident.get(level_id)
+            if entry is not None:
+                return entry.table.lineage, len(entry.table)
+            layout = self._layouts.get(level_id)
+            return (layout.lineage, len(layout)) if layout is not None else None
+
+    def resident(self):
+        """Identifiants des niveaux actuellement en mémoire"""
+        with self._lock:
+            return tuple(self._resident)
+
+    # ------------------------------------------------------------------
+    # Chargement
+    # ------------------------------------------------------------------
+    def _open(self, level_id):
+        """Charge (ou met à jour) un niveau et retourne son entrée"""
+        with self._lock:
+            now = time.monotonic()
+            level = self._snapshots.freeze_level(level_id, self.store.load_level(level_id))
+
+            entry = self._resident.get(level_id)
+            previous = entry.table if entry is not None else None
+            table = build_level_table(level_id, level, previous)
+            if previous is None or table.lineage is not previous.lineage:
+                # Rechargé ou reconstruit : garder les positions si le niveau n'a fait que grandir
+                layout = TableLayout(previous) if previous is not None else self._layouts.get(level_id)
+                table = (layout.rebuild(level_id, level) if layout is not None else None) or table
+            self._layouts.pop(level_id, None)
+            self.renders.prepare(table)
+
+            if entry is None:
+                entry = self._resident[level_id] = _ResidentLevel(level, table, now)
+            else:
+                entry.level, entry.table, entry.last_used = level, table, now
+            self._resident.move_to_end(level_id)
+            self.evict_idle(now)
+            return entry
+
+    def level(self, level_id):
+        """Données figées d'un niveau (nom, description, cartes), chargées au besoin"""
+        return self._open(level_id).level
+
+    def table(self, level_id):
+        """Table des cartes d'un niveau (LevelTable), chargée au besoin"""
+        return self._open(level_id).table
+
+    # ------------------------------------------------------------------
+    # Éviction
+    # ------------------------------------------------------------------
+    def evict(self, level_id):
+        """Retire un niveau de la mémoire en gardant la disposition de sa table"""
+        with self._lock:
+            entry = self._resident.pop(level_id, None)
+            if entry is None:
+                return
+            self._layouts[level_id] = TableLayout(entry.table)
+            self._snapshots.forget(level_id)
+            self.renders.forget(level_id)
+            self.store.forget_level(level_id)
+
+    def evict_idle(self, now=None):
+        """Retire les niveaux inactifs, puis les moins récents au-delà de max_resident"""
+        with self._lock:
+            now = time.monotonic() if now is None else now
+            # Le niveau le plus récent (en fin de liste) n'est jamais retiré
+            for level_id, entry in list(self._resident.items())[:-1]:
+                if now - entry.last_used > self.idle_seconds:
+                    self.evict(level_id)
+            if self.max_resident is not None:
+                while len(self._resident) > max(1, self.max_resident):
+                    self.evict(next(iter(self._resident)))
@@ -0,0 +1,134 @@
+# utils/mixer.py
+"""
+Séance mixte : tirage pondéré entre plusieurs niveaux (et la révision)
+"""
+
+import random
+
+# Pool des cartes dues (révision espacée), à côté des identifiants de niveau
+REVIEW = "review"
+
+# Les poids (60 %, 0.3, ...) sont ramenés à des entiers : tirage exact, sans dérive
+WEIGHT_SCALE = 1000
+
+
+class FenwickTree:
+    """
+    Arbre de Fenwick (arbre indexé binaire) de poids entiers positifs.
+
+    Modifier un poids et tirer un indice au prorata des poids coûtent
+    O(log n) : le tirage descend l'arbre au lieu de parcourir les sommes.
+    """
+
+    __slots__ = ("_tree", "_weights")
+
+    def __init__(self, weights=()):
+        self._weights = [int(weight) for weight in weights]
+        self._tree = [0] + self._weights
+        # Construction en O(n) : chaque nœud transmet sa somme à son parent
+        for index in range(1, len(self._tree)):
+            parent = index + (index & -index)
+            if parent < len(self._tree):
+                self._tree[parent] += self._tree[index]
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __getitem__(self, index):
+        return self._weights[index]
+
+    def update(self, index, weight):
+        """Remplace le poids d'un indice"""
+        delta = int(weight) - self._weights[index]
+        self._weights[index] = int(weight)
+        position = index + 1
+        while position < len(self._tree):
+            self._tree[position] += delta
+            position += position & -position
+
+    def total(self):
+        """Somme de tous les poids"""
+        total, position = 0, len(self._weights)
+        while position:
+            total += self._tree[position]
+            position -= position & -position
+        return total
+
+    def find(self, target):
+        """Premier indice dont la somme cumulée dépasse `target` (0 <= target < total)"""
+        position = 0
+        step = 1 << len(self._weights).bit_length()
+        while step:
+            following = position + step
+            if following < len(self._tree) and self._tree[following] <= target:
+                position = following
+                target -= self._tree[following]
+            step >>= 1
+        return position
+
+    def sample(self, rng=random):
+        """Indice tiré au prorata des poids, ou None si tous sont nuls"""
+        total = self.total()
+        return self.find(rng.randrange(total)) if total > 0 else None
+
+
+class MixedSampler:
+    """
+    Choisit le pool (niveau ou révision) de chaque carte d'une séance mixte.
+
+    Chaque pool garde sa part configurée (par exemple 60 % HSK 3, 30 % HSK 2,
+    10 % révision) tant qu'il lui reste des cartes ; un pool vidé sort du
+    tirage (poids nul) et les autres se partagent sa part. Les poids sont
+    tenus dans un arbre de Fenwick : tirage et mise à jour en O(log n).
+    """
+
+    def __init__(self, weights, rng=random):
+        self.pools = tuple(pool for pool, weight in weights.items() if weight > 0)
+        self.rng = rng
+        self._shares = tuple(max(1, round(weights[pool] * WEIGHT_SCALE)) for pool in self.pools)
+        self._positions = {pool: index for index, pool in enumerate(self.pools)}
+        self._tree = FenwickTree(self._shares)
+
+    def __contains__(self, pool):
+        return pool in self._positions
+
+    def set_available(self, pool, available):
+        """Remet un pool dans le tirage (il a des cartes) ou l'en retire (il est vide)"""
+        index = self._positions.get(pool)
+        if index is not None:
+            self._tree.update(index, self._shares[index] if available else 0)
+
+    def reset(self):
+        """Remet tous les pools dans le tirage avec leur part configurée"""
+        for index, share in enumerate(self._shares):
+            self._tree.update(index, share)
+
+    def probabilities(self):
+        """Part actuelle de chaque pool (les pools vidés comptent pour zéro)"""
+        total = self._tree.total()
+        return {pool: (self._tree[index] / total if total else 0.0)
+                for index, pool in enumerate(self.pools)}
+
+    def draw(self):
+        """Pool de la prochaine carte, ou None si tous sont vides"""
+        index = self._tree.sample(self.rng)
+        return None if index is None else self.pools[index]
+
+    def draw_card(self, take, remaining):
+        """
+        Tire (pool, carte) : `take(pool)` retourne une carte du pool ou None
+        s'il est vide, `remaining(pool)` indique s'il lui en reste ensuite.
+
+        Un pool trouvé vide sort du tirage et un autre est tiré ; retourne
+        None quand tous les pools sont vides.
+        """
+        while True:
+            pool = self.draw()
+            if pool is None:
+                return None
+            card = take(pool)
+            if card is None:
+                self.set_available(pool, False)
+                continue
+            self.set_available(pool, remaining(pool))
+            return pool, card
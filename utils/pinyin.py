@@ -0,0 +1,227 @@
+# utils/pinyin.py
+"""
+Normalisation du pinyin : formes à diacritiques, à chiffres et sans tons
+"""
+
+import re
+from functools import lru_cache
+
+# Syllabes du mandarin (ü noté v), pour découper un mot pinyin sans espaces
+SYLLABLES = frozenset("""
+a ai an ang ao e ei en eng er o ou
+ba bai ban bang bao bei ben beng bi bian biao bie bin bing bo bu
+pa pai pan pang pao pei pen peng pi pian piao pie pin ping po pou pu
+ma mai man mang mao me mei men meng mi mian miao mie min ming miu mo mou mu
+fa fan fang fei fen feng fo fou fu
+da dai dan dang dao de dei den deng di dia dian diao die ding diu dong dou du duan dui dun duo
+ta tai tan tang tao te teng ti tian tiao tie ting tong tou tu tuan tui tun tuo
+na nai nan nang nao ne nei nen neng ni nian niang niao nie nin ning niu nong nou nu nuan nuo nv nve
+la lai lan lang lao le lei leng li lia lian liang liao lie lin ling liu lo long lou lu luan lun luo lv lve
+ga gai gan gang gao ge gei gen geng gong gou gu gua guai guan guang gui gun guo
+ka kai kan kang kao ke kei ken keng kong kou ku kua kuai kuan kuang kui kun kuo
+ha hai han hang hao he hei hen heng hong hou hu hua huai huan huang hui hun huo
+ji jia jian jiang jiao jie jin jing jiong jiu ju juan jue jun
+qi qia qian qiang qiao qie qin qing qiong qiu qu quan que qun
+xi xia xian xiang xiao xie xin xing xiong xiu xu xuan xue xun
+zha zhai zhan zhang zhao zhe zhei zhen zheng zhi zhong zhou zhu zhua zhuai zhuan zhuang zhui zhun zhuo
+cha chai chan chang chao che chen cheng chi chong chou chu chua chuai chuan chuang chui chun chuo
+sha shai shan shang shao she shei shen sheng shi shou shu shua shuai shuan shuang shui shun shuo
+ra ran rang rao re ren reng ri rong rou ru rua ruan rui run ruo
+za zai zan zang zao ze zei zen zeng zi zong zou zu zuan zui zun zuo
+ca cai can cang cao ce cen ceng ci cong cou cu cuan cui cun cuo
+sa sai san sang sao se sen seng si song sou su suan sui sun suo
+ya yan yang yao ye yi yin ying yo yong you yu yuan yue yun
+wa wai wan wang wei wen weng wo wu
+""".split())
+MAX_SYLLABLE_LENGTH = max(map(len, SYLLABLES))
+
+# Voyelle de base -> formes marquées des tons 1 à 4
+TONE_MARKS = {
+    "a": "āáǎà", "e": "ēéěè", "i": "īíǐì", "o": "ōóǒò", "u": "ūúǔù", "v": "ǖǘǚǜ",
+    "A": "ĀÁǍÀ", "E": "ĒÉĚÈ", "I": "ĪÍǏÌ", "O": "ŌÓǑÒ", "U": "ŪÚǓÙ", "V": "ǕǗǙǛ",
+}
+
+# Tables précalculées : caractère marqué -> (voyelle de base, ton)
+_MARKED = {mark: (vowel, tone) for vowel, marks in TONE_MARKS.items()
+           for tone, mark in enumerate(marks, 1)}
+_MARKED.update({"ü": ("v", 0), "Ü": ("V", 0)})
+# Affichage sans tons (ü conservé) et clé de comparaison (ASCII, ü et v -> u)
+_TONELESS_TABLE = str.maketrans({mark: "ü" if vowel == "v" else ("Ü" if vowel == "V" else vowel)
+                                 for mark, (vowel, _) in _MARKED.items()})
+_KEY_TABLE = str.maketrans({mark: "u" for mark, (vowel, _) in _MARKED.items() if vowel in "vV"}
+                           | {mark: vowel.lower() for mark, (vowel, _) in _MARKED.items() if vowel not in "vV"}
+                           | {"v": "u", "V": "u"})
+
+_LETTERS = "A-Za-z" + "".join(_MARKED)
+WORD_PATTERN = re.compile(rf"[{_LETTERS}]+[1-5]?(?:'?[{_LETTERS}]+[1-5]?)*")
+SEGMENT_PATTERN = re.compile(rf"([{_LETTERS}]+)([1-5]?)")
+NON_KEY_PATTERN = re.compile(r"[^a-z]+")
+BATCH_NON_KEY_PATTERN = re.compile(r"[^a-z\0]+")
+
+
+@lru_cache(maxsize=65536)
+def split_syllables(word):
+    """
+    Découpe un mot pinyin sans tons (minuscules, ü noté v) en syllabes.
+
+    Retourne un tuple de syllabes, ou None si le mot n'est pas du pinyin.
+    Les syllabes les plus longues sont essayées d'abord (xian, pas xi'an) ;
+    une syllabe commençant par a, e ou o n'apparaît qu'en début de mot
+    (kěnéng : ke + neng), et le r final de l'erhua reste sur sa syllabe (diǎnr).
+    """
+    return _split(word, True)
+
+
+@lru_cache(maxsize=65536)
+def _split(word, initial):
+    if not word:
+        return ()
+    for end in range(min(len(word), MAX_SYLLABLE_LENGTH), 0, -1):
+        syllable = word[:end]
+        if syllable not in SYLLABLES or (not initial and syllable[0] in "aeo"):
+            continue
+        if word[end:end + 1] == "r" and word[end + 1:end + 2] not in ("a", "e", "i", "o", "u"):
+            rest = _split(word[end + 1:], False)
+            if rest is not None:
+                return (syllable + "r",) + rest
+        rest = _split(word[end:], False)
+        if rest is not None:
+            return (syllable,) + rest
+    return None
+
+
+@lru_cache(maxsize=65536)
+def _parse_word(word):
+    """
+    Syllabes d'un mot écrit en pinyin : tuple de (lettres d'origine sans tons, ton).
+
+    Le ton vient d'une voyelle marquée ou d'un chiffre final (0 : inconnu ou
+    neutre). Un segment qui n'est pas du pinyin reste d'un seul tenant.
+    """
+    syllables = []
+    for letters, digit in SEGMENT_PATTERN.findall(word):
+        plain = []
+        tones = []
+        for char in letters:
+            vowel, tone = _MARKED.get(char, (char, 0))
+            plain.append(vowel)
+            tones.append(tone)
+        parts = split_syllables("".join(plain).lower())
+        if parts is None:
+            parts = ("".join(plain),)
+
+        start = 0
+        for part in parts:
+            end = start + len(part)
+            tone = max(tones[start:end])
+            syllables.append(("".join(plain[start:end]), tone))
+            start = end
+        if digit:
+            last, tone = syllables[-1]
+            syllables[-1] = (last, tone or int(digit))
+    return tuple(syllables)
+
+
+def _umlaut(text):
+    """Remplace la graphie u: (nu:3) par ü"""
+    return text.replace("u:", "ü").replace("U:", "Ü")
+
+
+def _mark_syllable(syllable, tone):
+    """Place la marque du ton sur la bonne voyelle (a/e, puis o de ou, sinon la dernière)"""
+    if 1 <= tone <= 4:
+        lower = syllable.lower()
+        position = -1
+        for vowel in "ae":
+            if vowel in lower:
+                position = lower.index(vowel)
+                break
+        else:
+            if "ou" in lower:
+                position = lower.index("o")
+            else:
+                for index in range(len(lower) - 1, -1, -1):
+                    if lower[index] in "iouv":
+                        position = index
+                        break
+        if position >= 0:
+            syllable = (syllable[:position] + TONE_MARKS[syllable[position]][tone - 1]
+                        + syllable[position + 1:])
+    return syllable.replace("v", "ü").replace("V", "Ü")
+
+
+def _join(syllables):
+    """Recolle des syllabes en ajoutant l'apostrophe devant a, e, o (xī'ān)"""
+    text = syllables[0]
+    for syllable in syllables[1:]:
+        if syllable[:1].lower() in "aeoāáǎàēéěèōóǒò":
+            text += "'"
+        text += syllable
+    return text
+
+
+@lru_cache(maxsize=65536)
+def _word_to_diacritic(word):
+    return _join([_mark_syllable(syllable, tone) for syllable, tone in _parse_word(word)])
+
+
+@lru_cache(maxsize=65536)
+def _word_to_numeric(word):
+    return "".join(syllable + (str(tone) if tone else "") for syllable, tone in _parse_word(word))
+
+
+def to_diacritic(text):
+    """Pinyin à chiffres (xie4xie, lv4) -> pinyin à diacritiques (xièxie, lǜ)"""
+    return WORD_PATTERN.sub(lambda match: _word_to_diacritic(match.group()), _umlaut(text))
+
+
+def to_numeric(text):
+    """Pinyin à diacritiques (xièxie, lǜ) -> pinyin à chiffres (xie4xie, lv4)"""
+    return WORD_PATTERN.sub(lambda match: _word_to_numeric(match.group()), _umlaut(text))
+
+
+def to_toneless(text):
+    """Pinyin sans tons ni chiffres, ü conservé (Xièxie, xie4xie -> Xiexie, xiexie)"""
+    text = _umlaut(text).translate(_TONELESS_TABLE)
+    return re.sub(r"(?<=[A-Za-zü])[1-5]", "", text)
+
+
+def pinyin_key(text):
+    """
+    Clé de comparaison insensible aux tons, à la casse et aux espaces.
+
+    xièxie, xie4xie, Xie xie et xiexie donnent tous « xiexie » ; ü, u: et v
+    deviennent u (lǜ, lv4 -> lu).
+    """
+    return NON_KEY_PATTERN.sub("", text.translate(_KEY_TABLE).lower())
+
+
+def same_pinyin(answer, expected):
+    """Indique si deux pinyin sont identiques aux tons et à la présentation près"""
+    return pinyin_key(answer) == pinyin_key(expected)
+
+
+def pinyin_words(text):
+    """Clés des mots d'un texte pinyin (Nǐ hǎo ma ? -> ni, hao, ma ; xie4xie -> xiexie)"""
+    return [key for key in map(pinyin_key, WORD_PATTERN.findall(_umlaut(text))) if key]
+
+
+def pinyin_syllables(text):
+    """Syllabes sans tons d'un texte pinyin (xièxie nǐ -> xie, xie, ni)"""
+    return [syllable.lower().replace("v", "u")
+            for word in WORD_PATTERN.findall(_umlaut(text))
+            for syllable, _ in _parse_word(word)]
+
+
+def pinyin_keys(texts):
+    """
+    Clés de comparaison d'une série de textes, calculées en une seule passe.
+
+    Les textes sont joints par un séparateur : la table de traduction et
+    l'expression régulière tournent une fois sur le tout (boucles en C) au
+    lieu d'une fois par texte.
+    """
+    if not texts:
+        return []
+    joined = "\0".join(texts).translate(_KEY_TABLE).lower()
+    return BATCH_NON_KEY_PATTERN.sub("", joined).split("\0")
@@ -0,0 +1,122 @@
+# utils/prefetch.py
+"""
+Préchargement des prochaines cartes d'un paquet, hors du rerun qui affiche la carte
+"""
+
+import threading
+from collections import deque
+
+PREFETCH_DEPTH = 5
+
+
+class CardPrefetcher:
+    """
+    Garde d'avance les `depth` prochaines cartes d'un paquet, déjà préparées.
+
+    Un thread tire les cartes (sans les marquer vues) et appelle `render`
+    sur chacune ; passer à la carte suivante n'est alors qu'un retrait en
+    tête de file. Le remplissage est relancé en arrière-plan après chaque
+    retrait. Les cartes tirées avant une remise à zéro du paquet (génération
+    différente) sont écartées.
+    """
+
+    def __init__(self, deck, render=None, depth=PREFETCH_DEPTH):
+        self.deck = deck
+        self.render = render
+        self.depth = depth
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._refilling = False
+        self._cancelled = False
+
+    def __len__(self):
+        """Nombre de cartes prêtes (tirées d'avance et pas encore affichées)"""
+        with self._lock:
+            self._drop_stale()
+            return len(self._queue)
+
+    def _drop_stale(self):
+        """Écarte les cartes d'une génération précédente du paquet"""
+        while self._queue and self._queue[0][0] != self.deck.generation:
+            self._queue.popleft()
+
+    def take(self):
+        """
+        Retourne (carte, rendu) de la prochaine carte, marquée vue.
+
+        Si rien n'est prêt (premier appel, file vidée par une remise à zéro),
+        la carte est tirée et préparée immédiatement ; retourne None quand le
+        paquet est épuisé.
+        """
+        with self._lock:
+            self._drop_stale()
+            entry = self._queue.popleft() if self._queue else None
+
+        if entry is None:
+            entry = self._prepare()
+        self.refill_in_background()
+        if entry is None:
+            return None
+
+        _, card, rendered = entry
+        self.deck.mark_seen(card)
+        return card, rendered
+
+    def _prepare(self):
+        """Tire une carte d'avance et la prépare (génération, carte, rendu), ou None"""
+        with self._lock:
+            # Tirage sous le verrou : cancel() le prend avant que le paquet soit
+            # détaché (niveau retiré de la mémoire), la table est donc encore là
+            if self._cancelled:
+                return None
+            reserved = self.deck.reserve()
+        if reserved is None:
+            return None
+        generation, card = reserved
+        return (generation, card, self.render(card) if self.render else None)
+
+    def refill(self):
+        """Tire et prépare des cartes jusqu'à en avoir `depth` prêtes"""
+        while True:
+            with self._lock:
+                self._drop_stale()
+                if len(self._queue) >= self.depth:
+                    return
+            entry = self._prepare()
+            if entry is None:
+                return
+            with self._lock:
+                if self._cancelled:
+                    # Annulé pendant la préparation : rendre la carte au paquet
+                    self.deck.release(1)
+                    return
+                self._queue.append(entry)
+
+    def cancel(self):
+        """
+        Rend au paquet les cartes tirées d'avance et arrête le remplissage.
+
+        Toutes les cartes du paquet passent par le préchargement : les cartes
+        en attente sont donc les dernières tirées, et le curseur recule d'autant.
+        """
+        with self._lock:
+            self._cancelled = True
+            self._drop_stale()
+            self.deck.release(len(self._queue))
+            self._queue.clear()
+
+    def refill_in_background(self):
+        """Lance le remplissage dans un thread s'il n'est pas déjà en cours"""
+        with self._lock:
+            if self._refilling or self._cancelled:
+                return
+            self._refilling = True
+
+        def run():
+            try:
+                self.refill()
+            finally:
+                with self._lock:
+                    self._refilling = False
+
+        threading.Thread(target=run, name="card-prefetch", daemon=True).start()
@@ -0,0 +1,154 @@
+# utils/quiz.py
+"""
+Quiz à réponse tapée : correction d'une réponse, d'une feuille ou d'une classe
+"""
+
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from functools import lru_cache
+
+from utils.pinyin import pinyin_keys
+
+# Champs de la carte que l'apprenant peut avoir à taper
+PINYIN = "pinyin"
+TRANSLATION = "translation"
+FIELDS = (PINYIN, TRANSLATION)
+
+# Similarité minimale (difflib) pour accepter une faute de frappe
+FUZZY_THRESHOLD = {PINYIN: 0.8, TRANSLATION: 0.8}
+# Longueur minimale d'une réponse pour la tolérance aux fautes
+MIN_FUZZY_LENGTH = 4
+
+# Sens multiples d'une traduction (« je, moi », « il/elle ») et précisions entre parenthèses
+ALTERNATIVES_PATTERN = re.compile(r"\s*[,;/]\s*")
+PARENTHESES_PATTERN = re.compile(r"\([^)]*\)")
+COMBINING_PATTERN = re.compile(r"[̀-ͯ]+")
+NON_WORD_PATTERN = re.compile(r"[^a-z0-9\0]+")
+ARTICLE_PATTERN = re.compile(r"(?:(?<=\0)|^)(?:le|la|les|l|un|une|des|se|s) (?=[a-z])")
+
+
+def french_keys(texts):
+    """
+    Clés de comparaison de réponses en français, calculées en une seule passe.
+
+    Minuscules, sans accents, ponctuation ni article initial (« L'école » ->
+    « ecole ») ; comme pinyin_keys(), les textes sont traités joints, pour que
+    chaque expression régulière ne tourne qu'une fois sur le lot.
+    """
+    if not texts:
+        return []
+    joined = unicodedata.normalize("NFD", "\0".join(texts).lower())
+    joined = NON_WORD_PATTERN.sub(" ", COMBINING_PATTERN.sub("", joined))
+    joined = joined.replace(" \0", "\0").replace("\0 ", "\0").strip(" ")
+    return ARTICLE_PATTERN.sub("", joined).split("\0")
+
+
+def answer_keys(texts, field):
+    """Clés de comparaison de réponses pour ce champ (pinyin ou traduction)"""
+    return pinyin_keys(texts) if field == PINYIN else french_keys(texts)
+
+
+@lru_cache(maxsize=65536)
+def expected_keys(card, field):
+    """
+    Réponses acceptées pour une carte, précalculées une fois par carte.
+
+    Pour la traduction, chaque sens est accepté (« je, moi » : je ou moi, et
+    la traduction complète) ; les précisions entre parenthèses sont ignorées.
+    """
+    expected = getattr(card, field)
+    if field == PINYIN:
+        return frozenset(pinyin_keys([expected]))
+    text = PARENTHESES_PATTERN.sub("", expected)
+    keys = set(french_keys([text, *ALTERNATIVES_PATTERN.split(text)]))
+    keys.discard("")
+    return frozenset(keys)
+
+
+@lru_cache(maxsize=65536)
+def _similarity(answer_key, expected):
+    """Meilleure similarité entre une réponse et les réponses acceptées"""
+    return max((SequenceMatcher(None, answer_key, key).ratio() for key in expected), default=0.0)
+
+
+class Grade:
+    """Résultat d'une réponse : juste, juste avec une faute de frappe, ou fausse"""
+
+    __slots__ = ("correct", "exact", "score", "expected")
+
+    def __init__(self, correct, exact, score, expected):
+        self.correct = correct
+        self.exact = exact
+        self.score = score
+        self.expected = expected
+
+    @property
+    def quality(self):
+        """Note SM-2 correspondante (5 : exacte, 4 : faute de frappe, 1 : fausse)"""
+        if self.exact:
+            return 5
+        return 4 if self.correct else 1
+
+    def __repr__(self):
+        return f"Grade(correct={self.correct!r}, exact={self.exact!r}, score={self.score!r})"
+
+
+def _grade_key(answer_key, card, field):
+    """Note une réponse déjà normalisée"""
+    expected = expected_keys(card, field)
+    if answer_key in expected:
+        return Grade(True, True, 1.0, getattr(card, field))
+    if len(answer_key) < MIN_FUZZY_LENGTH:
+        return Grade(False, False, 0.0, getattr(card, field))
+    score = round(_similarity(answer_key, expected), 3)
+    return Grade(score >= FUZZY_THRESHOLD[field], False, score, getattr(card, field))
+
+
+def grade_answer(card, answer, field=PINYIN):
+    """Note la réponse tapée pour une carte (pinyin : tons facultatifs)"""
+    return grade_sheet([card], [answer], field)[0]
+
+
+def grade_sheet(cards, answers, field=PINYIN):
+    """Note une feuille de N réponses (une par carte) en une seule passe de normalisation"""
+    return grade_class(cards, [answers], field)[0]
+
+
+def grade_class(cards, sheets, field=PINYIN):
+    """
+    Note les feuilles de toute une classe pour les mêmes cartes.
+
+    Toutes les réponses sont normalisées en un seul lot ; chaque couple
+    (réponse, carte) distinct n'est noté qu'une fois, et les réponses
+    identiques (fréquentes dans une classe) réutilisent la même note.
+    Une réponse manquante (feuille plus courte) compte comme vide.
+    """
+    if field not in FIELDS:
+        raise ValueError(f"Champ inconnu : {field!r}")
+    width = len(cards)
+    if not width:
+        return [[] for _ in sheets]
+    flat = [sheet[position] if position < len(sheet) and sheet[position] else ""
+            for sheet in sheets for position in range(width)]
+    keys = answer_keys(flat, field)
+
+    grades = {}
+    results = []
+    for start in range(0, len(keys), width):
+        row = []
+        for card, key in zip(cards, keys[start:start + width]):
+            grade = grades.get((key, card))
+            if grade is None:
+                grade = grades[(key, card)] = _grade_key(key, card, field)
+            row.append(grade)
+        results.append(row)
+    return results
+
+
+def class_summary(results):
+    """Nombre de bonnes réponses par élève et taux de réussite par carte"""
+    per_student = [sum(grade.correct for grade in row) for row in results]
+    per_card = [sum(row[position].correct for row in results) / len(results)
+                for position in range(len(results[0]))] if results and results[0] else []
+    return per_student, per_card
@@ -0,0 +1,95 @@
+# utils/render.py
+"""
+Fragments HTML/Markdown des cartes, préparés une fois et échappés
+"""
+
+import html
+import re
+import threading
+
+# Caractères interprétés par le Markdown de Streamlit (gras, liens, LaTeX, HTML...)
+MARKDOWN_PATTERN = re.compile(r"([\\`*_{}\[\]<>#|~$])")
+
+BADGE_COLORS = {"character": "#f0b429", "sentence": "#c6466d"}
+BADGE_LABELS = {"character": "Caractère", "sentence": "Phrase"}
+
+# Messages d'attente (fixes, sans donnée de l'utilisateur)
+VOCAB_HINT = ("<p style='text-align: center; color: #666; font-style: italic;'>"
+              "Cliquez sur 'Voir réponse' pour afficher le pinyin et la traduction</p>")
+GRAMMAR_HINT = ("<p style='text-align: center; color: #666; font-style: italic; margin-top: 20px;'>"
+                "Cliquez sur 'Voir exemples et explication' pour afficher les détails</p>")
+
+
+def escape_markdown(text):
+    """Texte affiché tel quel par st.markdown/st.info (sans mise en forme ni HTML)"""
+    return MARKDOWN_PATTERN.sub(r"\\\1", text)
+
+
+class CardFragments:
+    """Fragments prêts à afficher d'une carte de vocabulaire"""
+
+    __slots__ = ("card", "character", "badge", "pinyin", "translation")
+
+    def __init__(self, card):
+        self.card = card
+        # Texte saisi par l'utilisateur : échappé avant d'entrer dans un bloc unsafe_allow_html
+        self.character = (f"<h1 style='text-align: center; font-size: 4em;'>"
+                          f"{html.escape(card.character)}</h1>")
+        self.badge = (f"<div style='background-color: {BADGE_COLORS.get(card.type, '#c6466d')}; "
+                      f"color: white; padding: 8px 20px; border-radius: 25px; text-align: center;'>"
+                      f"{BADGE_LABELS.get(card.type, 'Phrase')} • {html.escape((card.level or 'HSK').upper())}</div>")
+        self.pinyin = f"**{escape_markdown(card.pinyin)}**"
+        self.translation = f"**{escape_markdown(card.translation)}**"
+
+
+class GrammarFragments:
+    """Fragments prêts à afficher de l'exemple d'un point de grammaire"""
+
+    __slots__ = ("example", "pinyin", "translation")
+
+    def __init__(self, point):
+        self.example = f"<h3 style='text-align: center;'>{html.escape(point.get('example_ch', ''))}</h3>"
+        self.pinyin = f"**{escape_markdown(point.get('example_pinyin', ''))}**"
+        self.translation = f"**{escape_markdown(point.get('example_fr', ''))}**"
+
+
+class RenderCache:
+    """
+    Fragments des cartes de chaque niveau, calculés à la construction de sa table.
+
+    Une carte est retrouvée par sa clé (type + caractère) dans la version
+    de son niveau : la lignée de la table. Une table qui a seulement grandi
+    ne prépare que ses nouvelles cartes ; une table reconstruite
+    (dédoublonnage, niveau modifié) repart de zéro. Un rerun ne fait donc
+    qu'une recherche dans un dict, sans formatage de chaînes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._levels = {}
+
+    def prepare(self, table):
+        """Prépare les fragments des cartes de la table qui n'en ont pas encore"""
+        with self._lock:
+            lineage, count, fragments = self._levels.get(table.level, (None, 0, None))
+            if lineage is not table.lineage or count > len(table):
+                count, fragments = 0, {}
+            elif count == len(table):
+                return
+            for card in table.items[count:]:
+                fragments[card.key] = CardFragments(card)
+            self._levels[table.level] = (table.lineage, len(table), fragments)
+
+    def get(self, card):
+        """Fragments d'une carte (calculés à la volée si elle n'est pas dans une table préparée)"""
+        entry = self._levels.get(card.level)
+        fragments = entry[2].get(card.key) if entry is not None else None
+        if fragments is None or fragments.card is not card:
+            # Carte d'une autre version (révision due, doublon) : rien à mettre en cache
+            return CardFragments(card)
+        return fragments
+
+    def forget(self, level_id):
+        """Oublie les fragments d'un niveau (niveau retiré de la mémoire)"""
+        with self._lock:
+            self._levels.pop(level_id, None)
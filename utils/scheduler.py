@@ -0,0 +1,210 @@
+# utils/scheduler.py
+"""
+Planificateur de révisions espacées (algorithme SM-2)
+"""
+
+import heapq
+import itertools
+import json
+import os
+import re
+import threading
+import time
+
+from utils.storage import parse_record, repair_tail, write_atomic
+
+DAY = 86400
+# Une carte ratée revient dans la même séance, après ce délai (secondes)
+RELEARN_DELAY = 600
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+
+CARD_FIELDS = ("character", "pinyin", "translation", "type", "level")
+
+
+class CardState:
+    """État de révision d'une carte"""
+
+    __slots__ = ("item", "ease", "interval", "repetitions", "due", "seq")
+
+    def __init__(self, item, ease=DEFAULT_EASE, interval=0, repetitions=0, due=0.0):
+        self.item = item
+        self.ease = ease
+        self.interval = interval
+        self.repetitions = repetitions
+        self.due = due
+        self.seq = 0
+
+    def to_record(self, level, key):
+        """Enregistrement JSON pour le journal des révisions"""
+        return {
+            "level": level,
+            "key": key,
+            "item": self.item,
+            "ease": round(self.ease, 4),
+            "interval": self.interval,
+            "repetitions": self.repetitions,
+            "due": self.due
+        }
+
+
+def card_key(item):
+    """Clé d'une carte dans son niveau : type + caractère"""
+    return f"{item.get('type', 'character')}:{item['character']}"
+
+
+def sm2(state, quality, now):
+    """Met à jour l'état d'une carte selon la note SM-2 (0 à 5)"""
+    if quality < 3:
+        state.repetitions = 0
+        state.interval = 1
+        state.due = now + RELEARN_DELAY
+    else:
+        state.repetitions += 1
+        if state.repetitions == 1:
+            state.interval = 1
+        elif state.repetitions == 2:
+            state.interval = 6
+        else:
+            state.interval = round(state.interval * state.ease)
+        state.due = now + state.interval * DAY
+
+    state.ease = max(MIN_EASE, state.ease + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+    return state
+
+
+class ReviewScheduler:
+    """
+    Révisions d'un apprenant, avec un tas (min-heap) par niveau trié par échéance.
+
+    La prochaine carte due s'obtient en O(log n) ; une note replanifie la
+    carte sans retirer l'ancienne entrée du tas (elle est ignorée plus tard).
+    L'état est conservé dans un journal JSON en ajout seul, rejoué au
+    démarrage et compacté quand il devient trop long.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._cards = {}
+        self._heaps = {}
+        self._counter = itertools.count()
+        self._journal_lines = 0
+        self._load()
+
+    def _load(self):
+        """Rejoue le journal des révisions (une ligne abîmée par un plantage est sautée)"""
+        if not os.path.exists(self.path):
+            return
+        # Une dernière ligne interrompue absorberait le prochain ajout : la retirer
+        repair_tail(self.path)
+        with open(self.path, 'rb') as f:
+            for line in f:
+                record = parse_record(line) if line.strip() else None
+                if record is None:
+                    continue
+                state = CardState(record["item"], record["ease"], record["interval"],
+                                  record["repetitions"], record["due"])
+                self._schedule(record["level"], record["key"], state)
+                self._journal_lines += 1
+
+    def _schedule(self, level, key, state):
+        """Place (ou replace) une carte dans le tas de son niveau"""
+        state.seq = next(self._counter)
+        self._cards.setdefault(level, {})[key] = state
+        heapq.heappush(self._heaps.setdefault(level, []), (state.due, state.seq, key))
+
+    def _top(self, level):
+        """Entrée valide la plus urgente du niveau (les entrées périmées sont retirées)"""
+        heap = self._heaps.get(level)
+        cards = self._cards.get(level, {})
+        while heap:
+            due, seq, key = heap[0]
+            state = cards.get(key)
+            if state is not None and state.seq == seq:
+                return state
+            heapq.heappop(heap)
+        return None
+
+    def next_due(self, level, now=None, skip=()):
+        """
+        Carte la plus en retard du niveau, ou None si aucune n'est due.
+
+        Les cartes dont la clé est dans `skip` (déjà montrées, pas encore
+        notées) sont passées : la suivante par échéance est retournée.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            state = self._top(level)
+            if state is None or state.due > now:
+                return None
+            if card_key(state.item) not in skip:
+                return state.item
+
+            # Écarter les cartes passées le temps de trouver la suivante, puis les remettre
+            heap = self._heaps[level]
+            skipped = []
+            found = None
+            while True:
+                skipped.append(heapq.heappop(heap))
+                state = self._top(level)
+                if state is None or state.due > now:
+                    break
+                if card_key(state.item) not in skip:
+                    found = state.item
+                    break
+            for entry in skipped:
+                heapq.heappush(heap, entry)
+            return found
+
+    def grade(self, level, item, quality, now=None):
+        """Note une carte (0 à 5), la replanifie et enregistre son nouvel état"""
+        now = time.time() if now is None else now
+        key = card_key(item)
+        with self._lock:
+            state = self._cards.get(level, {}).get(key)
+            if state is None:
+                state = CardState({field: item[field] for field in CARD_FIELDS if field in item})
+            sm2(state, quality, now)
+            self._schedule(level, key, state)
+            self._append(state.to_record(level, key))
+            return state
+
+    def tracked(self, level):
+        """Nombre de cartes déjà révisées dans ce niveau"""
+        with self._lock:
+            return len(self._cards.get(level, {}))
+
+    def _append(self, record):
+        """Ajoute une ligne au journal, et le compacte s'il est deux fois trop long"""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_lines += 1
+
+        total_cards = sum(len(cards) for cards in self._cards.values())
+        if self._journal_lines > 2 * total_cards + 100:
+            self._compact()
+
+    def _compact(self):
+        """Réécrit le journal avec un seul enregistrement par carte"""
+        write_atomic(self.path, "".join(
+            json.dumps(state.to_record(level, key), ensure_ascii=False) + "\n"
+            for level, cards in self._cards.items()
+            for key, state in cards.items()
+        ))
+        self._journal_lines = sum(len(cards) for cards in self._cards.values())
+
+        # Les tas ne gardent que les entrées valides
+        for level, cards in self._cards.items():
+            heap = [(state.due, state.seq, key) for key, state in cards.items()]
+            heapq.heapify(heap)
+            self._heaps[level] = heap
+
+
+def review_path(directory, user):
+    """Chemin du journal de révisions d'un apprenant"""
+    safe_user = re.sub(r"[^\w-]", "_", user.strip()) or "default"
+    return os.path.join(directory, f"{safe_user}.jsonl")
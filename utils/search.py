@@ -0,0 +1,284 @@
+# utils/search.py
+"""
+Recherche plein texte (caractères, pinyin, traductions, exemples de grammaire)
+"""
+
+import bisect
+import heapq
+import math
+import re
+import threading
+import unicodedata
+from operator import itemgetter
+
+from utils.pinyin import pinyin_key, pinyin_syllables, pinyin_words
+
+CJK_PATTERN = re.compile(r"[㐀-䶿一-鿿豈-﫿]+")
+# Mots français trop fréquents pour servir à la recherche
+STOP_WORDS = frozenset((
+    "a", "au", "aux", "ce", "d", "de", "des", "du", "en", "est", "et", "l", "la",
+    "le", "les", "n", "ne", "pas", "que", "qu", "s", "se", "un", "une", "y"
+))
+# Bonus d'une correspondance exacte avec le mot entier (caractère, pinyin ou traduction)
+EXACT_BONUS = 10.0
+PREFIX_WEIGHT = 0.5
+COVERAGE_WEIGHT = 1000.0
+MIN_PREFIX_LENGTH = 3
+
+
+def fold(text):
+    """Minuscules sans accents ni tons (xièxie -> xiexie, Été -> ete)"""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def pinyin_tokens(text):
+    """Mots pinyin sans tons d'une requête (wǒ, wo, wo3 -> wo ; xie4xie -> xiexie)"""
+    return pinyin_words(text)
+
+
+def pinyin_terms(text):
+    """
+    Termes pinyin d'un document : mots, syllabes et texte entier sans espaces.
+
+    « xièxie » est trouvé par xiexie, xie4xie et xie xie ; « nǐ hǎo » par nihao.
+    """
+    terms = set(pinyin_words(text))
+    terms.update(pinyin_syllables(text))
+    key = pinyin_key(text)
+    if key:
+        terms.add(key)
+    return terms
+
+
+def french_tokens(text):
+    """Mots d'une traduction, sans accents ni mots vides"""
+    return [token for token in re.findall(r"[a-z0-9]+", fold(text)) if token not in STOP_WORDS]
+
+
+def chinese_ngrams(text):
+    """Caractères chinois seuls et paires de caractères consécutifs"""
+    grams = []
+    for run in CJK_PATTERN.findall(text):
+        grams.extend(run)
+        grams.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return grams
+
+
+class VocabEntry:
+    """Copie compacte d'un mot indexé (l'index ne garde ni les cartes ni les tables)"""
+
+    __slots__ = ("character", "pinyin", "translation", "level")
+
+    def __init__(self, card):
+        self.character = card.character
+        self.pinyin = card.pinyin
+        self.translation = card.translation
+        self.level = card.level
+
+
+class SearchResult:
+    """Résultat classé : mot du vocabulaire (VocabEntry) ou point de grammaire"""
+
+    __slots__ = ("kind", "item", "score")
+
+    def __init__(self, kind, item, score):
+        self.kind = kind
+        self.item = item
+        self.score = score
+
+
+class SearchIndex:
+    """
+    Index inversé terme -> documents, construit une fois par version des données.
+
+    Trois familles de termes : n-grammes de caractères chinois (« zh: »),
+    pinyin sans tons (« py: ») et mots français (« fr: »). Les mots ajoutés
+    à un niveau sont indexés sans reconstruire le reste (voir update()).
+    Chaque niveau est suivi par sa version (lignée, nombre de cartes), sans
+    garder sa table : un niveau retiré de la mémoire reste cherchable.
+    """
+
+    def __init__(self):
+        self._documents = []
+        self._postings = {}
+        self._exact = {}
+        self._sorted_terms = None
+        self._versions = {}
+        self._grammar = None
+
+    def __len__(self):
+        return len(self._documents)
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+    def _add_document(self, kind, item, chinese, pinyin, french):
+        """Indexe un document à partir de ses textes chinois, pinyin et français"""
+        doc_id = len(self._documents)
+        self._documents.append((kind, item))
+
+        terms = set("zh:" + gram for gram in chinese_ngrams(chinese))
+        terms.update("py:" + token for token in pinyin_terms(pinyin))
+        terms.update("fr:" + token for token in french_tokens(french))
+        for term in terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = []
+                self._sorted_terms = None
+            postings.append(doc_id)
+
+        # Formes complètes, pour favoriser les correspondances exactes
+        for key in (chinese, pinyin_key(pinyin), " ".join(french_tokens(french))):
+            if key:
+                self._exact.setdefault(key, []).append(doc_id)
+
+    def add_card(self, card):
+        """Indexe un mot ou une phrase du vocabulaire"""
+        self._add_document("vocab", VocabEntry(card), card.character, card.pinyin, card.translation)
+
+    def add_grammar_point(self, point):
+        """Indexe un point de grammaire (titre, structure et exemple)"""
+        self._add_document(
+            "grammar", point,
+            " ".join((point["title"], point["structure"], point["example_ch"])),
+            point.get("example_pinyin", ""),
+            " ".join((point.get("example_fr", ""), point.get("explanation", "")))
+        )
+
+    def update(self, tables, catalogue):
+        """
+        Met l'index à jour pour ces tables de niveaux (LevelTable) et ce catalogue.
+
+        Retourne False si une table a été reconstruite (suppressions) : il faut
+        alors un nouvel index, les documents ne pouvant pas être retirés.
+        """
+        for level_id, table in tables.items():
+            previous = self._versions.get(level_id)
+            indexed = 0
+            if previous is not None:
+                lineage, indexed = previous
+                if lineage is not table.lineage or len(table) < indexed:
+                    return False
+            for card in table.items[indexed:]:
+                self.add_card(card)
+            self._versions[level_id] = (table.lineage, len(table))
+
+        if catalogue is not self._grammar:
+            if self._grammar is not None:
+                return False
+            for point in catalogue.points:
+                self.add_grammar_point(point)
+            self._grammar = catalogue
+        return True
+
+    def version(self, level_id):
+        """Version (lignée, nombre de cartes) indexée pour ce niveau, ou None"""
+        return self._versions.get(level_id)
+
+    def covers(self, catalogue):
+        """Indique si ce catalogue de grammaire est déjà indexé"""
+        return catalogue is self._grammar
+
+    # ------------------------------------------------------------------
+    # Recherche
+    # ------------------------------------------------------------------
+    def _prefix_terms(self, prefix):
+        """Termes de l'index commençant par `prefix`"""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        start = bisect.bisect_left(self._sorted_terms, prefix)
+        end = bisect.bisect_left(self._sorted_terms, prefix + "￿")
+        return self._sorted_terms[start:end]
+
+    def search(self, query, limit=20):
+        """
+        Documents classés pour une requête (chinois, pinyin avec ou sans tons, français).
+
+        Chaque terme de la requête rapporte son idf aux documents qui le
+        contiennent ; un document qui couvre plus de termes passe devant, et
+        une correspondance exacte avec le mot entier passe en tête.
+        """
+        query = query.strip()
+        if not query:
+            return []
+
+        # Un groupe par terme de la requête : termes exacts + complétions du préfixe
+        query_terms = []
+        for gram in set(chinese_ngrams(query)):
+            query_terms.append(({"zh:" + gram}, ["zh:" + gram]))
+        for token in set(pinyin_tokens(query)) | set(french_tokens(query)):
+            exact = {"py:" + token, "fr:" + token}
+            terms = list(exact)
+            if len(token) >= MIN_PREFIX_LENGTH:
+                terms = self._prefix_terms("py:" + token) + self._prefix_terms("fr:" + token)
+            query_terms.append((exact, terms))
+
+        # Score = COVERAGE_WEIGHT par terme couvert + idf : couvrir un terme de
+        # plus l'emporte toujours sur les poids
+        total = len(self._documents)
+        scores = {}
+        for exact, terms in query_terms:
+            weighted = []
+            for term in terms:
+                postings = self._postings.get(term)
+                if postings:
+                    weight = math.log(1 + total / len(postings))
+                    weighted.append((weight if term in exact else weight * PREFIX_WEIGHT, postings))
+            # Par poids croissant : chaque document garde son meilleur poids (boucles en C)
+            matched = {}
+            for weight, postings in sorted(weighted, key=itemgetter(0)):
+                matched.update(dict.fromkeys(postings, weight + COVERAGE_WEIGHT))
+            if not scores:
+                scores = matched
+                continue
+            for doc_id, weight in matched.items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight
+
+        for key in (query, pinyin_key(query), " ".join(french_tokens(query))):
+            for doc_id in self._exact.get(key, ()):
+                if doc_id in scores:
+                    scores[doc_id] += EXACT_BONUS
+
+        best = heapq.nlargest(limit, scores.items(), key=itemgetter(1))
+        return [SearchResult(*self._documents[doc_id], round(score % COVERAGE_WEIGHT, 3))
+                for doc_id, score in best]
+
+
+class SearchIndexCache:
+    """
+    Un index par processus, tenu à jour avec les niveaux du registre.
+
+    Un niveau n'est chargé que si sa version a changé depuis son indexation
+    (lignée connue du registre, nombre de cartes tenu par le stockage en
+    O(1)) : une recherche ne recharge pas les niveaux retirés de la mémoire.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._index = None
+
+    def _fresh(self, registry, counts, level_id):
+        """Indique si l'index contient la version actuelle du niveau"""
+        indexed = self._index.version(level_id)
+        if indexed is None or indexed[1] != counts.level(level_id).total:
+            return False
+        current = registry.version(level_id)
+        return current is None or current == indexed
+
+    def get(self, registry, catalogue):
+        """Retourne l'index à jour (reconstruit seulement si des mots ont disparu)"""
+        with self._lock:
+            level_ids = registry.ids()
+            if self._index is not None and self._index.covers(catalogue):
+                counts = registry.store.stats()
+                stale = [level_id for level_id in level_ids if not self._fresh(registry, counts, level_id)]
+                if not stale:
+                    return self._index
+            else:
+                stale = level_ids
+            tables = {level_id: registry.table(level_id) for level_id in stale}
+            if self._index is None or not self._index.update(tables, catalogue):
+                self._index = SearchIndex()
+                self._index.update({level_id: registry.table(level_id) for level_id in level_ids}, catalogue)
+            return self._index
@@ -0,0 +1,71 @@
+# utils/snapshot.py
+"""
+Instantanés en lecture seule des données, partagés entre toutes les sessions
+"""
+
+import threading
+from types import MappingProxyType
+
+from utils.card import CARD_TYPES, Card
+
+
+def freeze(value):
+    """Convertit récursivement dicts et listes en vues en lecture seule"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(v) for key, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class SnapshotCache:
+    """
+    Fige les niveaux du vocabulaire, un à la fois, pour tout le processus.
+
+    Seules les listes modifiées sont refigées : une liste qui a seulement
+    grandi (ajout de mots) réutilise les éléments déjà figés.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._frozen_lists = {}
+
+    def _freeze_items(self, key, items):
+        """Fige une liste d'éléments en réutilisant la version précédente si possible"""
+        level_id, category = key
+        card_type = CARD_TYPES.get(category)
+
+        def freeze_item(index, item):
+            # Mots et phrases deviennent des cartes compactes (Card)
+            if card_type is None:
+                return freeze(item)
+            return Card.from_json(item, level_id, card_type, index)
+
+        source, frozen = self._frozen_lists.get(key, (None, ()))
+        if source is items and len(items) >= len(frozen):
+            frozen = frozen + tuple(freeze_item(index, item)
+                                    for index, item in enumerate(items[len(frozen):], len(frozen)))
+        else:
+            frozen = tuple(freeze_item(index, item) for index, item in enumerate(items))
+        self._frozen_lists[key] = (items, frozen)
+        return frozen
+
+    def _freeze_level(self, level_id, level):
+        frozen_level = {}
+        for key, value in level.items():
+            if isinstance(value, list):
+                frozen_level[key] = self._freeze_items((level_id, key), value)
+            else:
+                frozen_level[key] = freeze(value)
+        return MappingProxyType(frozen_level)
+
+    def freeze_level(self, level_id, level):
+        """Fige un niveau (en lecture seule, cartes Card pour les mots et phrases)"""
+        with self._lock:
+            return self._freeze_level(level_id, level)
+
+    def forget(self, level_id):
+        """Oublie les listes figées d'un niveau (niveau retiré de la mémoire)"""
+        with self._lock:
+            for key in [key for key in self._frozen_lists if key[0] == level_id]:
+                del self._frozen_lists[key]
@@ -0,0 +1,355 @@
+# utils/sqlite_store.py
+"""
+Stockage du vocabulaire dans une base SQLite (module standard sqlite3)
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import threading
+
+from utils.stats import VocabularyStats
+from utils.storage import JournalStore, VersionConflictError
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS levels (
+    id          TEXT PRIMARY KEY,
+    name        TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    position    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vocabulary (
+    id          INTEGER PRIMARY KEY,
+    level       TEXT NOT NULL,
+    category    TEXT NOT NULL,
+    character   TEXT NOT NULL,
+    pinyin      TEXT NOT NULL,
+    translation TEXT NOT NULL,
+    UNIQUE (level, category, character)
+);
+CREATE INDEX IF NOT EXISTS idx_vocabulary_level ON vocabulary (level);
+CREATE INDEX IF NOT EXISTS idx_vocabulary_type ON vocabulary (level, category);
+"""
+
+CATEGORIES = ("characters", "sentences")
+
+
+class SQLiteStore:
+    """
+    Vocabulaire stocké dans SQLite, une ligne par mot.
+
+    Expose la même interface que JournalStore (load/append/save/...) ; les
+    comptages, la détection de doublons et les tirages aléatoires sont faits
+    par la base au lieu de parcourir des listes Python.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.RLock()
+        # Plusieurs processus écrivent : WAL (lecteurs non bloqués) et attente du verrou
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._data = None
+        self._version = None
+        self._writes = 0
+        self._stats = VocabularyStats()
+        self._stats_data_version = None
+        # Niveaux chargés un par un : identifiant -> (version, données du niveau)
+        self._levels = {}
+
+    def close(self):
+        """Ferme la connexion à la base"""
+        with self._lock:
+            self._conn.close()
+
+    def _current_version(self):
+        """Version des données : écritures d'autres connexions + les nôtres"""
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        return (data_version, self._writes)
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def exists(self):
+        """Indique si la base contient au moins un niveau"""
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM levels LIMIT 1").fetchone() is not None
+
+    def load(self):
+        """Retourne les données au format JSON habituel (niveau -> listes)"""
+        with self._lock:
+            if not self.exists():
+                raise FileNotFoundError(self.path)
+
+            version = self._current_version()
+            if self._data is not None and version == self._version:
+                return self._data
+
+            data = {}
+            for row in self._conn.execute("SELECT id, name, description FROM levels ORDER BY position"):
+                data[row["id"]] = {
+                    "name": row["name"],
+                    "description": row["description"],
+                    "characters": [],
+                    "sentences": []
+                }
+
+            rows = self._conn.execute(
+                "SELECT level, category, character, pinyin, translation FROM vocabulary ORDER BY id"
+            )
+            for row in rows:
+                if row["level"] in data:
+                    data[row["level"]][row["category"]].append({
+                        "character": row["character"],
+                        "pinyin": row["pinyin"],
+                        "translation": row["translation"]
+                    })
+
+            self._data = data
+            self._version = version
+            return data
+
+    def levels(self):
+        """Niveaux de la base dans leur ordre : [(identifiant, nom, description)]"""
+        with self._lock:
+            return [tuple(row) for row in
+                    self._conn.execute("SELECT id, name, description FROM levels ORDER BY position")]
+
+    def load_level(self, level_id):
+        """
+        Données d'un seul niveau (lève KeyError s'il n'existe pas).
+
+        Seules les lignes de ce niveau sont lues (index sur level) ; le résultat
+        est gardé tant que la base ne change pas.
+        """
+        with self._lock:
+            version = self._current_version()
+            cached = self._levels.get(level_id)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+
+            row = self._conn.execute(
+                "SELECT name, description FROM levels WHERE id = ?", (level_id,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(level_id)
+            level = {"name": row["name"], "description": row["description"], "characters": [], "sentences": []}
+            for item in self._conn.execute(
+                "SELECT category, character, pinyin, translation FROM vocabulary WHERE level = ? ORDER BY id",
+                (level_id,)
+            ):
+                level[item["category"]].append({
+                    "character": item["character"],
+                    "pinyin": item["pinyin"],
+                    "translation": item["translation"]
+                })
+            self._levels[level_id] = (version, level)
+            return level
+
+    def forget_level(self, level_id):
+        """Libère les données d'un niveau chargé par load_level()"""
+        with self._lock:
+            self._levels.pop(level_id, None)
+
+    def version(self):
+        """
+        Version actuelle de la base (écritures de toutes les connexions).
+
+        À relever avec la lecture, puis à repasser à save(expected_version=...).
+        """
+        with self._lock:
+            return self._current_version()
+
+    def count(self, level, category):
+        """Nombre d'éléments d'un niveau pour une catégorie"""
+        return getattr(self.stats().level(level), category)
+
+    def stats(self):
+        """
+        Totaux par niveau et par type.
+
+        Nos écritures les mettent à jour directement ; ils ne sont recomptés
+        (une requête GROUP BY) que si une autre connexion a modifié la base.
+        """
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._stats_data_version:
+                self._rebuild_stats()
+                self._stats_data_version = data_version
+            return self._stats
+
+    def _rebuild_stats(self):
+        """Recompte les éléments de chaque niveau"""
+        counts = {row[0]: {} for row in self._conn.execute("SELECT id FROM levels ORDER BY position")}
+        for level, category, total in self._conn.execute(
+            "SELECT level, category, COUNT(*) FROM vocabulary GROUP BY level, category"
+        ):
+            counts.setdefault(level, {})[category] = total
+        self._stats.rebuild(counts)
+
+    def contains(self, level, category, character):
+        """Indique si le caractère existe déjà dans ce niveau/catégorie"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM vocabulary WHERE level = ? AND category = ? AND character = ?",
+                (level, category, character)
+            ).fetchone() is not None
+
+    def find(self, level, category, character):
+        """Élément de ce caractère dans ce niveau/catégorie, ou None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT character, pinyin, translation FROM vocabulary "
+                "WHERE level = ? AND category = ? AND character = ?",
+                (level, category, character)
+            ).fetchone()
+            return dict(row) if row is not None else None
+
+    def character_index(self, level, category):
+        """Ensemble des caractères d'un niveau/catégorie (pour dédoublonner un import)"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute(
+                "SELECT character FROM vocabulary WHERE level = ? AND category = ?",
+                (level, category)
+            )}
+
+    def random_item(self, level, category):
+        """Tire un élément au hasard dans la base, ou None si la catégorie est vide"""
+        with self._lock:
+            total = self.count(level, category)
+            if total == 0:
+                return None
+            row = self._conn.execute(
+                "SELECT character, pinyin, translation FROM vocabulary "
+                "WHERE level = ? AND category = ? ORDER BY id LIMIT 1 OFFSET ?",
+                (level, category, random.randrange(total))
+            ).fetchone()
+            return dict(row)
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def _insert_levels(self, data):
+        """Insère ou met à jour les niveaux et leur contenu"""
+        for position, (level_id, level) in enumerate(data.items()):
+            self._conn.execute(
+                "INSERT INTO levels (id, name, description, position) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET name = excluded.name, description = excluded.description",
+                (level_id, level.get("name", level_id.upper()), level.get("description", ""), position)
+            )
+            for category in CATEGORIES:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO vocabulary (level, category, character, pinyin, translation) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    ((level_id, category, item["character"], item["pinyin"], item["translation"])
+                     for item in level.get(category, []))
+                )
+
+    def append(self, level, category, element):
+        """Ajoute un élément ; retourne False si le caractère existe déjà"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO vocabulary (level, category, character, pinyin, translation) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (level, category, element["character"], element["pinyin"], element["translation"])
+            )
+            self._writes += 1
+            if cursor.rowcount == 1:
+                self._stats.add(level, category)
+            return cursor.rowcount == 1
+
+    def append_many(self, level, category, elements):
+        """Ajoute plusieurs éléments dans une seule transaction et retourne le nombre ajouté"""
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO vocabulary (level, category, character, pinyin, translation) "
+                "VALUES (?, ?, ?, ?, ?)",
+                ((level, category, element["character"], element["pinyin"], element["translation"])
+                 for element in elements)
+            )
+            self._writes += 1
+            added = self._conn.total_changes - before
+            self._stats.add(level, category, added)
+            return added
+
+    def create_level(self, level_id, name, description=""):
+        """Crée un niveau vide (paquet personnalisé) ; retourne False s'il existe déjà"""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO levels (id, name, description, position) "
+                "SELECT ?, ?, ?, COALESCE(MAX(position) + 1, 0) FROM levels",
+                (level_id, name, description)
+            )
+            self._writes += 1
+            if cursor.rowcount == 1:
+                self._stats.add(level_id, "characters", 0)
+            return cursor.rowcount == 1
+
+    def save(self, data, expected_version=None):
+        """
+        Remplace tout le contenu de la base par ces données.
+
+        Avec `expected_version` (valeur de version() au moment de la lecture),
+        lève VersionConflictError si la base a changé entre-temps.
+        """
+        with self._lock, self._conn:
+            if expected_version is not None and self._current_version() != expected_version:
+                raise VersionConflictError(self.path)
+            self._conn.execute("DELETE FROM vocabulary")
+            self._conn.execute("DELETE FROM levels")
+            self._insert_levels(data)
+            self._writes += 1
+            self._rebuild_stats()
+
+    def deduplicate(self):
+        """Supprime les doublons (la contrainte UNIQUE les empêche déjà) et les retourne"""
+        with self._lock, self._conn:
+            duplicate_filter = (
+                "id NOT IN (SELECT MIN(id) FROM vocabulary GROUP BY level, category, character)"
+            )
+            removed = [dict(row) for row in self._conn.execute(
+                "SELECT level, category, character, pinyin, translation FROM vocabulary WHERE "
+                + duplicate_filter
+            )]
+            if removed:
+                self._conn.execute("DELETE FROM vocabulary WHERE " + duplicate_filter)
+                self._writes += 1
+                for row in removed:
+                    self._stats.remove(row["level"], row["category"])
+            return removed
+
+    def import_json(self, json_path):
+        """
+        Importe un fichier hsk_data.json (les mots déjà présents sont ignorés).
+
+        Le journal d'ajouts du fichier (hsk_data.json.journal) est rejoué :
+        les mots ajoutés depuis le dernier compactage sont importés aussi.
+        """
+        data = JournalStore(json_path).load()
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._insert_levels(data)
+            self._writes += 1
+            self._rebuild_stats()
+            return self._conn.total_changes - before
+
+
+if __name__ == "__main__":
+    # Import : python -m utils.sqlite_store data/hsk_data.db data/hsk_data.json [data/hsk_data_clean.json]
+    if len(sys.argv) < 3:
+        print("Usage: python -m utils.sqlite_store BASE.db FICHIER.json [FICHIER.json ...]")
+        sys.exit(1)
+
+    store = SQLiteStore(sys.argv[1])
+    for json_file in sys.argv[2:]:
+        changes = store.import_json(json_file)
+        print(f"✅ {json_file}: {changes} lignes importées/mises à jour")
+    for level_id, level in store.load().items():
+        print(f"{level_id.upper()}: {len(level['characters'])} caractères, {len(level['sentences'])} phrases")
+    store.close()
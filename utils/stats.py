@@ -0,0 +1,70 @@
+# utils/stats.py
+"""
+Totaux du vocabulaire par niveau et par type, tenus à jour par le stockage
+"""
+
+from utils.card import CARD_TYPES
+
+
+class LevelCounts:
+    """Nombre de caractères et de phrases d'un niveau"""
+
+    __slots__ = ("characters", "sentences")
+
+    def __init__(self, characters=0, sentences=0):
+        self.characters = characters
+        self.sentences = sentences
+
+    @property
+    def total(self):
+        return self.characters + self.sentences
+
+
+class VocabularyStats:
+    """
+    Agrégats du vocabulaire, mis à jour à chaque écriture du stockage.
+
+    Le stockage appelle add()/remove() pour chaque ajout ou suppression et
+    rebuild() quand il recharge tout ; les lectures (compteurs de la barre
+    latérale, page Statistiques) sont alors en O(1), sans parcourir les listes.
+    """
+
+    def __init__(self):
+        self._levels = {}
+        self.characters = 0
+        self.sentences = 0
+
+    @property
+    def total(self):
+        return self.characters + self.sentences
+
+    def rebuild(self, counts):
+        """Repart de {niveau: {catégorie: nombre}} (ou des données au format JSON)"""
+        self._levels = {}
+        self.characters = 0
+        self.sentences = 0
+        for level_id, level in counts.items():
+            self._levels[level_id] = LevelCounts()
+            for category in CARD_TYPES:
+                value = level.get(category, 0)
+                self.add(level_id, category, value if isinstance(value, int) else len(value))
+
+    def add(self, level_id, category, count=1):
+        """Compte `count` éléments ajoutés"""
+        level = self._levels.get(level_id)
+        if level is None:
+            level = self._levels[level_id] = LevelCounts()
+        setattr(level, category, getattr(level, category) + count)
+        setattr(self, category, getattr(self, category) + count)
+
+    def remove(self, level_id, category, count=1):
+        """Compte `count` éléments supprimés"""
+        self.add(level_id, category, -count)
+
+    def level(self, level_id):
+        """Compteurs d'un niveau (zéro s'il est inconnu)"""
+        return self._levels.get(level_id) or LevelCounts()
+
+    def levels(self):
+        """Identifiants des niveaux comptés, dans l'ordre du stockage"""
+        return tuple(self._levels)
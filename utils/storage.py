@@ -0,0 +1,560 @@
+# utils/storage.py
+"""
+Stockage du vocabulaire : fichier JSON de base + journal d'ajouts
+"""
+
+import json
+import os
+import random
+import threading
+
+from utils.stats import VocabularyStats
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou consultatif entre processus
+    fcntl = None
+
+DATA_FILE = "data/hsk_data.json"
+DB_FILE = "data/hsk_data.db"
+JOURNAL_SUFFIX = ".journal"
+LOCK_SUFFIX = ".lock"
+CATEGORIES = ("characters", "sentences")
+
+
+def clean_file(data_file):
+    """Chemin de la version nettoyée d'un fichier de données (hsk_data.json -> hsk_data_clean.json)"""
+    base, extension = os.path.splitext(data_file)
+    return f"{base}_clean{extension}"
+
+
+def open_store(backend=None, data_file=DATA_FILE, db_file=DB_FILE):
+    """
+    Ouvre le stockage du vocabulaire : "json" (JSON + journal) ou "sqlite".
+
+    Sans backend explicite, la variable d'environnement HSK_STORAGE décide.
+    À la première ouverture, la base SQLite importe le fichier JSON existant
+    puis sa version nettoyée (hsk_data_clean.json) si elle existe : en cas
+    de doublon, l'élément du fichier principal est gardé.
+    """
+    backend = backend or os.environ.get("HSK_STORAGE", "json")
+    if backend == "sqlite":
+        from utils.sqlite_store import SQLiteStore
+
+        store = SQLiteStore(db_file)
+        if not store.exists():
+            for json_file in (data_file, clean_file(data_file)):
+                if os.path.exists(json_file):
+                    store.import_json(json_file)
+        return store
+    return JournalStore(data_file)
+
+
+class VersionConflictError(RuntimeError):
+    """Les données ont été modifiées par un autre écrivain depuis leur lecture"""
+
+
+def _fsync_directory(path):
+    """Rend durable un renommage dans le dossier (sans effet hors POSIX)"""
+    if os.name != "posix":
+        return
+    fd = os.open(os.path.dirname(path) or ".", os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def write_temp(path, text):
+    """Écrit le texte (ou les octets) dans un fichier temporaire synchronisé sur disque et retourne son chemin"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with (open(tmp_path, 'wb') if isinstance(text, bytes) else open(tmp_path, 'w', encoding='utf-8')) as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    return tmp_path
+
+
+def replace_file(tmp_path, path):
+    """Remplace atomiquement `path` par le fichier temporaire"""
+    os.replace(tmp_path, path)
+    _fsync_directory(path)
+
+
+def repair_tail(path):
+    """
+    Tronque un journal en ajout seul après sa dernière ligne complète.
+
+    Une écriture interrompue (plantage, disque plein) laisse une ligne sans
+    fin de ligne : l'ajout suivant s'y collerait en une ligne illisible.
+    À appeler avant d'écrire, sous le verrou des écrivains du journal.
+    """
+    try:
+        f = open(path, 'rb+')
+    except FileNotFoundError:
+        return
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        if end == 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            return
+        position = end
+        while position > 0:
+            start = max(0, position - 65536)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b"\n")
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            f.truncate(position)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def parse_record(line):
+    """Enregistrement JSON d'une ligne de journal, ou None si elle est illisible (ligne abîmée)"""
+    try:
+        return json.loads(line)
+    except ValueError:
+        return None
+
+
+def write_atomic(path, text):
+    """
+    Écrit un fichier sans jamais laisser de version tronquée.
+
+    Fichier temporaire + fsync + renommage : en cas de plantage, le fichier
+    contient soit l'ancienne, soit la nouvelle version.
+    """
+    replace_file(write_temp(path, text), path)
+
+
+class FileLock:
+    """
+    Verrou consultatif exclusif entre processus (fcntl.flock sur un fichier .lock).
+
+    Réentrant dans un même thread ; sans fcntl (Windows), seul le verrou
+    entre threads du processus s'applique.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, 'a')
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            except BaseException:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+class JournalStore:
+    """
+    Fichier JSON complet + journal en ajout seul (une ligne JSON par mot).
+
+    Ajouter un mot n'écrit qu'une ligne dans le journal ; le chargement
+    rejoue le journal sur la base, et le compactage (fusion du journal dans
+    la base) se fait en arrière-plan quand le journal devient trop long.
+
+    Les écritures prennent un verrou de fichier (court, le temps d'ajouter
+    une ligne) et la base n'est jamais réécrite en place : fichier
+    temporaire + fsync + renommage. Les lectures n'ont pas besoin du verrou.
+    """
+
+    def __init__(self, path, compact_threshold=500):
+        self.path = path
+        self.journal_path = path + JOURNAL_SUFFIX
+        self._file_lock = FileLock(path + LOCK_SUFFIX)
+        self.compact_threshold = compact_threshold
+        self._lock = threading.RLock()
+        self._data = None
+        self._stats = VocabularyStats()
+        self._base_stamp = None
+        self._journal_offset = 0
+        self._journal_records = 0
+        self._journal_inode = None
+        self._compacting = False
+        # (niveau, catégorie) -> (liste indexée, {caractère: position}, positions en double)
+        self._index = {}
+
+    # ------------------------------------------------------------------
+    # Lecture
+    # ------------------------------------------------------------------
+    def _stamp(self, path):
+        """Identifie une version d'un fichier (date de modification + taille + inode)"""
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def exists(self):
+        """Indique si le fichier de base existe"""
+        return os.path.exists(self.path)
+
+    def load(self):
+        """Retourne les données à jour (lève FileNotFoundError si pas de base)"""
+        with self._lock:
+            stamp = self._stamp(self.path)
+            if self._data is None or stamp != self._base_stamp:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+                self._stats.rebuild(self._data)
+                self._base_stamp = stamp
+                self._journal_offset = 0
+                self._journal_records = 0
+            self._replay()
+            return self._data
+
+    def levels(self):
+        """
+        Niveaux du stockage dans leur ordre : [(identifiant, nom, description)].
+
+        Passe par load() : le fichier JSON est lu en entier (puis gardé tant
+        qu'il ne change pas) ; seul SQLiteStore lit la liste sans les mots.
+        """
+        with self._lock:
+            return [(level_id, level.get("name", level_id.upper()), level.get("description", ""))
+                    for level_id, level in self.load().items()]
+
+    def load_level(self, level_id):
+        """
+        Données d'un seul niveau (lève KeyError s'il n'existe pas).
+
+        Le fichier JSON est de toute façon lu en entier : les listes
+        retournées sont celles des données chargées, tenues à jour par le journal.
+        """
+        with self._lock:
+            return self.load()[level_id]
+
+    def forget_level(self, level_id):
+        """Sans effet : le fichier JSON reste chargé en entier"""
+
+    def version(self):
+        """
+        Version des données chargées (base + position dans le journal).
+
+        À repasser à save(expected_version=...) pour une écriture optimiste.
+        """
+        with self._lock:
+            return (self._base_stamp, self._journal_offset)
+
+    def _replay(self):
+        """Rejoue les lignes du journal ajoutées depuis le dernier chargement"""
+        try:
+            stat = os.stat(self.journal_path)
+            size, inode = stat.st_size, stat.st_ino
+        except FileNotFoundError:
+            size, inode = 0, None
+
+        if size < self._journal_offset or (self._journal_offset and inode != self._journal_inode):
+            # Journal remplacé par un compactage : tout recharger
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._data = json.load(f)
+            self._stats.rebuild(self._data)
+            self._base_stamp = self._stamp(self.path)
+            self._journal_offset = 0
+            self._journal_records = 0
+
+        self._journal_inode = inode
+        if size == self._journal_offset:
+            return
+
+        with open(self.journal_path, 'rb') as f:
+            f.seek(self._journal_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Ligne incomplète (écriture en cours) : on la relira plus tard
+                    break
+                self._journal_offset += len(line)
+                record = parse_record(line) if line.strip() else None
+                if record is not None:
+                    # Une ligne abîmée (écriture interrompue) est sautée : le reste du journal compte
+                    self._apply(record)
+                    self._journal_records += 1
+
+    def count(self, level, category):
+        """Nombre d'éléments d'un niveau pour une catégorie"""
+        return getattr(self.stats().level(level), category)
+
+    def stats(self):
+        """Totaux par niveau et par type, tenus à jour à chaque écriture (O(1))"""
+        with self._lock:
+            self.load()
+            return self._stats
+
+    def contains(self, level, category, character):
+        """Indique si le caractère existe déjà dans ce niveau/catégorie (O(1))"""
+        with self._lock:
+            self.load()
+            return character in self._index_entry(level, category)[1]
+
+    def find(self, level, category, character):
+        """Élément de ce caractère dans ce niveau/catégorie, ou None (O(1))"""
+        with self._lock:
+            self.load()
+            if level not in self._data or category not in self._data[level]:
+                return None
+            items, positions, _ = self._index_entry(level, category)
+            position = positions.get(character)
+            return items[position] if position is not None else None
+
+    def character_index(self, level, category):
+        """Ensemble (en mémoire) des caractères d'un niveau/catégorie, tenu à jour"""
+        with self._lock:
+            self.load()
+            return self._index_entry(level, category)[1].keys()
+
+    def _index_entry(self, level, category):
+        """
+        Index caractère -> position d'une catégorie.
+
+        L'index suit les ajouts du journal ; il n'est reconstruit que si la
+        liste a été remplacée (rechargement de la base, dédoublonnage...).
+        """
+        items = self._data[level][category]
+        entry = self._index.get((level, category))
+        if entry is None or entry[0] is not items:
+            positions = {}
+            duplicates = []
+            for position, item in enumerate(items):
+                if item["character"] in positions:
+                    duplicates.append(position)
+                else:
+                    positions[item["character"]] = position
+            entry = (items, positions, duplicates)
+            self._index[(level, category)] = entry
+        return entry
+
+    def random_item(self, level, category):
+        """Tire un élément au hasard, ou None si la catégorie est vide"""
+        items = self.load()[level][category]
+        return random.choice(items) if items else None
+
+    def _apply(self, record):
+        """Applique un enregistrement du journal (idempotent)"""
+        if record.get("op") != "add":
+            return
+        items, positions, _ = self._index_entry(record["level"], record["category"])
+        element = record["item"]
+        if element["character"] in positions:
+            return
+        positions[element["character"]] = len(items)
+        items.append(element)
+        self._stats.add(record["level"], record["category"])
+
+    # ------------------------------------------------------------------
+    # Écriture
+    # ------------------------------------------------------------------
+    def append(self, level, category, element):
+        """
+        Ajoute un élément en écrivant une seule ligne dans le journal.
+
+        Retourne False si le caractère existe déjà (y compris s'il vient
+        d'être ajouté par un autre processus).
+        """
+        return self.append_many(level, category, [element]) == 1
+
+    def append_many(self, level, category, elements):
+        """
+        Ajoute plusieurs éléments en une seule écriture dans le journal.
+
+        Le contrôle des doublons est refait sous le verrou de fichier, après
+        relecture du journal ; retourne le nombre d'éléments réellement ajoutés.
+        """
+        with self._lock, self._file_lock:
+            self.load()
+            _, positions, _ = self._index_entry(level, category)
+            records = []
+            characters = set()
+            for element in elements:
+                if element["character"] in positions or element["character"] in characters:
+                    continue
+                characters.add(element["character"])
+                records.append({"op": "add", "level": level, "category": category, "item": element})
+            if not records:
+                return 0
+
+            payload = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            payload = payload.encode('utf-8')
+            # Une ligne laissée incomplète par un écrivain interrompu ne doit pas absorber la suivante
+            repair_tail(self.journal_path)
+            with open(self.journal_path, 'ab') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+                end = f.tell()
+                # Journal créé par cet ajout (après save() ou un premier lancement) : ce n'est pas un remplacement
+                inode = os.fstat(f.fileno()).st_ino
+
+            if end - len(payload) == self._journal_offset:
+                # Personne n'a écrit entre-temps : appliquer sans relire le journal
+                for record in records:
+                    self._apply(record)
+                self._journal_offset = end
+                self._journal_records += len(records)
+                self._journal_inode = inode
+            else:
+                self._replay()
+            # Compacter quand le journal pèse autant que la moitié de la base :
+            # le coût des réécritures reste proportionnel au volume ajouté
+            needs_compaction = (self._journal_records >= self.compact_threshold
+                                and 2 * self._journal_offset >= self._base_stamp[1])
+
+        if needs_compaction:
+            self.compact_in_background()
+        return len(records)
+
+    def save(self, data, expected_version=None):
+        """
+        Réécrit entièrement la base (atomiquement) et vide le journal.
+
+        Avec `expected_version` (valeur de version() au moment de la lecture),
+        lève VersionConflictError si un autre écrivain a modifié les données
+        entre-temps, au lieu d'écraser ses ajouts.
+        """
+        with self._lock, self._file_lock:
+            if expected_version is not None and self.exists():
+                self.load()
+                if self.version() != expected_version:
+                    raise VersionConflictError(self.path)
+            write_atomic(self.path, json.dumps(data, ensure_ascii=False, indent=2))
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            # Les données ont pu être modifiées en place depuis load() : compteurs
+            # et index sont recalculés (la sauvegarde est déjà en O(n))
+            self._stats.rebuild(data)
+            self._index.clear()
+            self._data = data
+            self._base_stamp = self._stamp(self.path)
+            self._journal_offset = 0
+            self._journal_records = 0
+            self._journal_inode = None
+
+    def create_level(self, level_id, name, description=""):
+        """
+        Crée un niveau vide (paquet personnalisé) ; retourne False s'il existe déjà.
+
+        Lève VersionConflictError si un autre processus a écrit depuis la lecture.
+        """
+        with self._lock:
+            data = self.load()
+            if level_id in data:
+                return False
+            expected_version = self.version()
+            # Les données chargées ne changent qu'une fois la sauvegarde acceptée
+            data = dict(data)
+            data[level_id] = {"name": name, "description": description, "characters": [], "sentences": []}
+            self.save(data, expected_version)
+            return True
+
+    def deduplicate(self):
+        """
+        Supprime les doublons et retourne la liste des éléments retirés.
+
+        Seules les catégories dont l'index a relevé des doublons sont
+        réécrites, et le fichier n'est sauvegardé que si quelque chose change.
+        Le tri se fait sans le verrou de fichier : si un autre processus a
+        écrit entre-temps, VersionConflictError est levée et rien n'est retiré.
+        """
+        with self._lock:
+            data = self.load()
+            expected_version = self.version()
+            cleaned = dict(data)
+            removed = []
+            for level_id, level in data.items():
+                for category in CATEGORIES:
+                    if category not in level:
+                        continue
+                    items, _, duplicates = self._index_entry(level_id, category)
+                    if not duplicates:
+                        continue
+                    duplicate_positions = set(duplicates)
+                    removed.extend(
+                        dict(items[position], level=level_id, category=category)
+                        for position in duplicates
+                    )
+                    cleaned[level_id] = dict(cleaned[level_id])
+                    cleaned[level_id][category] = [item for position, item in enumerate(items)
+                                                   if position not in duplicate_positions]
+            if removed:
+                self.save(cleaned, expected_version)
+            return removed
+
+    # ------------------------------------------------------------------
+    # Compactage
+    # ------------------------------------------------------------------
+    def compact(self):
+        """Fusionne le journal dans le fichier de base"""
+        with self._lock:
+            data = self.load()
+            if self._journal_records == 0:
+                return
+            # Copie des listes seulement (les éléments ne sont jamais modifiés, seulement ajoutés)
+            snapshot = {level_id: {key: list(value) if isinstance(value, list) else value
+                                   for key, value in level.items()}
+                        for level_id, level in data.items()}
+            offset = self._journal_offset
+            base_stamp = self._base_stamp
+
+        # Sérialiser et écrire la nouvelle base hors verrou : lectures et ajouts continuent
+        tmp_path = write_temp(self.path, json.dumps(snapshot, ensure_ascii=False, indent=2))
+
+        with self._lock, self._file_lock:
+            if self._stamp(self.path) != base_stamp:
+                # Un autre processus a déjà réécrit la base : instantané périmé
+                os.remove(tmp_path)
+                return
+            # Conserver les lignes arrivées pendant l'écriture (sans une ligne interrompue)
+            repair_tail(self.journal_path)
+            self._replay()
+            with open(self.journal_path, 'rb') as f:
+                f.seek(offset)
+                tail = f.read()
+            replace_file(tmp_path, self.path)
+            write_atomic(self.journal_path, tail)
+            self._base_stamp = self._stamp(self.path)
+            self._journal_inode = os.stat(self.journal_path).st_ino
+            self._journal_offset -= offset
+            self._journal_records = tail[:self._journal_offset].count(b"\n")
+
+    def compact_in_background(self):
+        """Lance le compactage dans un thread s'il n'est pas déjà en cours"""
+        with self._lock:
+            if self._compacting:
+                return
+            self._compacting = True
+
+        def run():
+            try:
+                self.compact()
+            finally:
+                with self._lock:
+                    self._compacting = False
+
+        threading.Thread(target=run, name="journal-compaction", daemon=True).start()